@@ -186,7 +186,7 @@ SCRAPING = {
         
         # AI Models
         "whisper_model": os.getenv('DEFAULT_WHISPER_MODEL', 'whisper-1'),
-        "segmentation_model": os.getenv('DEFAULT_SEGMENTATION_MODEL', 'gpt-4'),
+        "segmentation_model": os.getenv('DEFAULT_SEGMENTATION_MODEL', 'gpt-4o-mini'),
         
         # Transcription Settings
         "response_format": os.getenv('DEFAULT_WHISPER_FORMAT', 'verbose_json'),
@@ -222,6 +222,12 @@ SCRAPING = {
             },
             "video_fps": int(os.getenv('DEFAULT_CARD_FPS', '30')),
             "output_dir": os.getenv('DEFAULT_CARD_OUTPUT_DIR', 'data/latest/multimedia'),
+            "capture_mode": os.getenv('DEFAULT_CARD_CAPTURE_MODE', 'native'),  # 'native' (Playwright video recording), 'screencast' (CDP frames) or 'screenshot'
+            "concurrency": int(os.getenv('DEFAULT_CARD_CONCURRENCY', '4')),  # Cards recorded at once on a shared browser
+            "hw_encoder": os.getenv('DEFAULT_CARD_HW_ENCODER', 'auto'),  # 'auto', 'vaapi' or 'none' for the ffmpeg capture modes
+            "dedupe": os.getenv('DEFAULT_CARD_DEDUPE', 'True').lower() == 'true',  # Reuse unchanged frames instead of re-decoding them
+            # libvpx speed/quality flags; use "-deadline good -cpu-used 2" for slower, higher quality offline encodes
+            "encoder_args": os.getenv('DEFAULT_CARD_ENCODER_ARGS', '-deadline realtime -cpu-used 8 -lag-in-frames 0 -error-resilient 1 -auto-alt-ref 0').split(),
             
             # Card-specific durations (in seconds)
             "card_durations": {
@@ -250,6 +256,9 @@ SCRAPING = {
                 "width": int(os.getenv('DEFAULT_WEATHER_VIEWPORT_WIDTH', '1200')),
                 "height": int(os.getenv('DEFAULT_WEATHER_VIEWPORT_HEIGHT', '800'))
             },
+            "capture_mode": os.getenv('DEFAULT_WEATHER_CAPTURE_MODE', 'native'),  # 'native' (Playwright video recording) or 'screencast' (CDP frames + OpenCV)
+            "max_parallel": int(os.getenv('DEFAULT_WEATHER_MAX_PARALLEL', '4')),  # Cities captured at once, one browser per worker
+            "persistent_profile": os.getenv('DEFAULT_WEATHER_PERSISTENT_PROFILE', 'False').lower() == 'true',  # Per-city Chromium profile (HTTP cache) across runs; launches one Chromium per capture, bypassing the pooled browser
         "output_dir": os.getenv('DEFAULT_WEATHER_RECORDER_OUTPUT', 'data/latest/multimedia'),
         "description": "Default weather recorder configuration for provincial weather capture"
         }
@@ -296,6 +305,18 @@ DEFAULT_SEGMENT_DURATION = SCRAPING["subtitle_defaults"]["segment_duration"]
 DEFAULT_INTRO_OUTRO = SCRAPING["subtitle_defaults"]["intro_outro"]
 DEFAULT_SUBTITLE_AI_SETTINGS = SCRAPING["subtitle_defaults"]["ai_settings"]
 
+# Card Recorder Capture Defaults - Direct Access Variables
+DEFAULT_CARD_CAPTURE_MODE = SCRAPING["card_defaults"]["capture_mode"]
+DEFAULT_CARD_CONCURRENCY = SCRAPING["card_defaults"]["concurrency"]
+DEFAULT_CARD_HW_ENCODER = SCRAPING["card_defaults"]["hw_encoder"]
+DEFAULT_CARD_DEDUPE = SCRAPING["card_defaults"]["dedupe"]
+DEFAULT_CARD_ENCODER_ARGS = SCRAPING["card_defaults"]["encoder_args"]
+
+# Weather Recorder Capture Defaults - Direct Access Variables
+DEFAULT_WEATHER_CAPTURE_MODE = SCRAPING["weather_recorder_defaults"]["capture_mode"]
+DEFAULT_WEATHER_MAX_PARALLEL = SCRAPING["weather_recorder_defaults"]["max_parallel"]
+DEFAULT_WEATHER_PERSISTENT_PROFILE = SCRAPING["weather_recorder_defaults"]["persistent_profile"]
+
 # AI Model Configuration
 AI_CONFIG = {
     "openai": {
@@ -312,6 +333,11 @@ AI_CONFIG = {
 # Text-to-Speech Configuration (Enhanced with news-style options)
 TTS_CONFIG = {
     "provider": os.getenv("TTS_PROVIDER", "elevenlabs"),  # Default to 'elevenlabs' for weather, options: "openai", "elevenlabs", "google"
+    "concurrency": int(os.getenv("TTS_CONCURRENCY", "4")),  # Max in-flight TTS requests per run
+    "retry": {
+        "attempts": int(os.getenv("TTS_RETRY_ATTEMPTS", "3")),  # Tries per segment on 429/5xx (ElevenLabs, Google)
+        "delay": int(os.getenv("TTS_RETRY_DELAY", "1000")),  # First backoff in ms, doubled each retry
+    },
     "openai": {
         "voice": os.getenv("TTS_OPENAI_VOICE", "alloy"),
         "speed": float(os.getenv("TTS_OPENAI_SPEED", "0.9")),
@@ -328,6 +354,7 @@ TTS_CONFIG = {
             "use_speaker_boost": os.getenv("TTS_ELEVENLABS_SPEAKER_BOOST", "True").lower() == 'true'
         },
         "output_format": os.getenv("TTS_ELEVENLABS_FORMAT", "mp3_44100_128"),
+        "streaming": os.getenv("TTS_ELEVENLABS_STREAMING", "True").lower() == 'true',  # Stream bytes as they are synthesized
         "chunk_length_schedule": [120, 160, 250, 370],
     },
     "google": {
@@ -517,11 +544,19 @@ def get_all_config() -> Dict[str, Any]:
         "DEFAULT_CARD_FPS": SCRAPING["card_defaults"]["video_fps"],
         "DEFAULT_CARD_OUTPUT_DIR": SCRAPING["card_defaults"]["output_dir"],
         "DEFAULT_CARD_DURATIONS": SCRAPING["card_defaults"]["card_durations"],
+        "DEFAULT_CARD_CAPTURE_MODE": SCRAPING["card_defaults"]["capture_mode"],
+        "DEFAULT_CARD_CONCURRENCY": SCRAPING["card_defaults"]["concurrency"],
+        "DEFAULT_CARD_HW_ENCODER": SCRAPING["card_defaults"]["hw_encoder"],
+        "DEFAULT_CARD_DEDUPE": SCRAPING["card_defaults"]["dedupe"],
+        "DEFAULT_CARD_ENCODER_ARGS": SCRAPING["card_defaults"]["encoder_args"],
         # Weather Recorder Defaults for direct access
         "DEFAULT_WEATHER_VIDEO_DURATION": SCRAPING["weather_recorder_defaults"]["video_duration"],
         "DEFAULT_WEATHER_VIDEO_FPS": SCRAPING["weather_recorder_defaults"]["video_fps"],
         "DEFAULT_WEATHER_VIEWPORT": (SCRAPING["weather_recorder_defaults"]["viewport"]["width"], SCRAPING["weather_recorder_defaults"]["viewport"]["height"]),
         "DEFAULT_WEATHER_RECORDER_OUTPUT": SCRAPING["weather_recorder_defaults"]["output_dir"],
+        "DEFAULT_WEATHER_CAPTURE_MODE": SCRAPING["weather_recorder_defaults"]["capture_mode"],
+        "DEFAULT_WEATHER_MAX_PARALLEL": SCRAPING["weather_recorder_defaults"]["max_parallel"],
+        "DEFAULT_WEATHER_PERSISTENT_PROFILE": SCRAPING["weather_recorder_defaults"]["persistent_profile"],
     }
 
 # Export all configuration 
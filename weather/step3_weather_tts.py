@@ -5,230 +5,449 @@ This script generates audio files from weather_scripts.json using configurable T
 """
 
 import os
+import io
+import re
+import html
 import json
+import sys
+import time
+import random
+import queue
+import atexit
+import logging
+import logging.handlers
+import asyncio
+import shutil
+import hashlib
+import functools
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 import openai
+from openai import AsyncOpenAI
 from pathlib import Path
 from datetime import datetime
+from types import MappingProxyType
 from google.cloud import texttospeech
 from pydub import AudioSegment
+from mutagen.mp3 import MP3
 from dotenv import load_dotenv
 from config import TTS_CONFIG, LANGUAGE, OPENAI_API_KEY
 
+try:
+    import av
+    import numpy as np
+except ImportError:
+    av = None  # Fall back to pydub (one ffmpeg process per segment) for combining
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the stdlib json encoder for the manifest
+
+logger = logging.getLogger('weather.tts')
+
+def start_log_listener():
+    """Route TTS output through a queue so worker threads only enqueue records.
+    
+    A single QueueListener thread formats and writes them to stdout in order,
+    keeping the plain print-style output. LOGLEVEL=DEBUG shows script previews.
+    Runs on import so library callers get the output too (skipped if the logger
+    already has handlers); queued records are flushed at interpreter exit.
+    """
+    if logger.handlers:
+        return None
+    
+    log_queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    logger.setLevel(os.environ.get('LOGLEVEL', 'INFO').upper())
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.propagate = False
+    
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+start_log_listener()
+
+# Content-addressed store of rendered segments shared by all providers
+AUDIO_CACHE_DIR = os.path.join('generated', 'audio_cache')
+
+def measure_audio_duration(audio_bytes, audio_format="mp3"):
+    """Return the duration in seconds of encoded audio held in memory"""
+    try:
+        # Header-only parse, no decode
+        return MP3(io.BytesIO(audio_bytes)).info.length
+    except Exception:
+        # Let ffmpeg decode from a pipe instead of re-opening and probing the file
+        return len(AudioSegment.from_file(io.BytesIO(audio_bytes), format=audio_format)) / 1000.0
+
+def _probe_duration(path):
+    """Return the duration in seconds of an audio file from its header, without decoding it"""
+    try:
+        return MP3(path).info.length
+    except Exception:
+        # Non-MP3 or unreadable header: ask ffprobe for the container duration
+        return float(subprocess.check_output([
+            'ffprobe', '-v', 'error', '-show_entries', 'format=duration', '-of', 'csv=p=0', path
+        ]))
+
+# Map segment types to potential media file patterns
+SEGMENT_TO_MEDIA_MAP = {
+    'weather_map1': ['weather_map1.webm'],
+    'weather_map2': ['weather_map2.webm'],
+    'card_temperature': ['card-temperature.webm'],
+    'card_feels_like': ['card-feels-like.webm'],
+    'card_cloud_cover': ['card-cloud-cover.webm'],
+    'card_precipitation': ['card-precipitation.webm'],
+    'card_wind': ['card-wind.webm'],
+    'card_humidity': ['card-humidity.webm'],
+    'card_uv': ['card-uv.webm'],
+    'card_aqi': ['card-aqi.webm'],
+    'card_visibility': ['card-visibility.webm'],
+    'card_pressure': ['card-pressure.webm'],
+    'card_sun': ['card-sun.webm'],
+    'card_moon': ['card-moon.webm'],
+    'card_current': ['card-current.webm'],
+    'card_hourly': ['card-hourly.webm'],
+    'weather_overview': ['weather_overview.webm'],
+    'weather_current_overview': ['weather_current_overview.webm']
+}
+
+_MEDIA_FILENAMES = frozenset(name for names in SEGMENT_TO_MEDIA_MAP.values() for name in names)
+
+@functools.lru_cache(maxsize=1)
+def _media_index():
+    """Sizes in bytes of the segment media in generated/media, from a single directory scan"""
+    media_dir = os.path.join('generated', 'media')
+    try:
+        with os.scandir(media_dir) as entries:
+            # Only stat the files a segment can reference; other recordings in the folder are skipped
+            return {entry.name: entry.stat().st_size for entry in entries if entry.name in _MEDIA_FILENAMES}
+    except FileNotFoundError:
+        return {}
+
 def get_media_files_for_segment(segment_type):
     """Get media files associated with a weather segment"""
-    media_dir = os.path.join('generated', 'media')
     media_files = []
-    
-    if not os.path.exists(media_dir):
-        return media_files
-    
-    # Map segment types to potential media file patterns
-    segment_to_media_map = {
-        'weather_map1': ['weather_map1.webm'],
-        'weather_map2': ['weather_map2.webm'],
-        'card_temperature': ['card-temperature.webm'],
-        'card_feels_like': ['card-feels-like.webm'],
-        'card_cloud_cover': ['card-cloud-cover.webm'],
-        'card_precipitation': ['card-precipitation.webm'],
-        'card_wind': ['card-wind.webm'],
-        'card_humidity': ['card-humidity.webm'],
-        'card_uv': ['card-uv.webm'],
-        'card_aqi': ['card-aqi.webm'],
-        'card_visibility': ['card-visibility.webm'],
-        'card_pressure': ['card-pressure.webm'],
-        'card_sun': ['card-sun.webm'],
-        'card_moon': ['card-moon.webm'],
-        'card_current': ['card-current.webm'],
-        'card_hourly': ['card-hourly.webm'],
-        'weather_overview': ['weather_overview.webm'],
-        'weather_current_overview': ['weather_current_overview.webm']
-    }
+    media_index = _media_index()
     
     # Get potential file names for this segment
-    potential_files = segment_to_media_map.get(segment_type, [])
+    potential_files = SEGMENT_TO_MEDIA_MAP.get(segment_type, [])
     
     for media_filename in potential_files:
-        media_path = os.path.join(media_dir, media_filename)
-        if os.path.exists(media_path):
-            try:
-                # Get file size in MB
-                file_size_bytes = os.path.getsize(media_path)
-                file_size_mb = round(file_size_bytes / (1024 * 1024), 2)
-                
-                media_info = {
-                    "video": media_filename,
-                    "path": os.path.join("media", media_filename).replace("\\", "/"),
-                    "type": f"{segment_type}_video",
-                    "original_name": media_filename,
-                    "size_mb": file_size_mb
-                }
-                media_files.append(media_info)
-                
-                print(f"    📹 Found media: {media_filename} ({file_size_mb} MB)")
-                
-            except Exception as e:
-                print(f"    ⚠️  Warning: Could not process media file {media_filename}: {e}")
+        file_size_bytes = media_index.get(media_filename)
+        if file_size_bytes is not None:
+            # Get file size in MB
+            file_size_mb = round(file_size_bytes / (1024 * 1024), 2)
+            
+            media_info = {
+                "video": media_filename,
+                "path": f"media/{media_filename}",
+                "type": f"{segment_type}_video",
+                "original_name": media_filename,
+                "size_mb": file_size_mb
+            }
+            media_files.append(media_info)
+            
+            logger.info(f"    📹 Found media: {media_filename} ({file_size_mb} MB)")
     
     return media_files
 
 # Load environment variables from .env file
 load_dotenv()
-print(f"Loaded environment variables from .env file")
+logger.info("Loaded environment variables from .env file")
 
 # Fix PATH to include ffmpeg location
 if "/opt/homebrew/bin" not in os.environ.get("PATH", ""):
     os.environ["PATH"] = f"/opt/homebrew/bin:/usr/local/bin:{os.environ.get('PATH', '')}"
-    print(f"Added Homebrew paths to PATH for ffmpeg access")
+    logger.info("Added Homebrew paths to PATH for ffmpeg access")
 
 # Print TTS configuration
-print(f"TTS Provider: {TTS_CONFIG['provider']}")
-print(f"Language: {LANGUAGE}")
+logger.info(f"TTS Provider: {TTS_CONFIG['provider']}")
+logger.info(f"Language: {LANGUAGE}")
 
 # Import and configure providers based on TTS_CONFIG
 if TTS_CONFIG['provider'] == 'elevenlabs':
     try:
         from elevenlabs.client import ElevenLabs
         from elevenlabs import VoiceSettings
-        print(f"Using ElevenLabs Text-to-Speech API")
+        logger.info("Using ElevenLabs Text-to-Speech API")
     except ImportError:
-        print("Error: ElevenLabs library not installed. Install with: pip install elevenlabs")
+        logger.error("Error: ElevenLabs library not installed. Install with: pip install elevenlabs")
         exit(1)
 elif TTS_CONFIG['provider'] == 'openai':
-    print(f"Using OpenAI Text-to-Speech API")
+    logger.info("Using OpenAI Text-to-Speech API")
 elif TTS_CONFIG['provider'] == 'google':
-    print(f"Using Google Cloud Text-to-Speech API")
+    logger.info("Using Google Cloud Text-to-Speech API")
     
     # Set up Google Cloud credentials if needed
     credentials_file = "../promising-cairn-283201-f7bb9e4c5c4f.json"
     if os.path.exists(credentials_file):
         os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = os.path.abspath(credentials_file)
-        print(f"Google Cloud credentials set: {os.path.abspath(credentials_file)}")
+        logger.info(f"Google Cloud credentials set: {os.path.abspath(credentials_file)}")
     elif "GOOGLE_APPLICATION_CREDENTIALS" not in os.environ:
-        print("Warning: GOOGLE_APPLICATION_CREDENTIALS environment variable not set!")
-        print("Please set it manually or place the credentials file in the project directory.")
+        logger.warning("Warning: GOOGLE_APPLICATION_CREDENTIALS environment variable not set!")
+        logger.warning("Please set it manually or place the credentials file in the project directory.")
 else:
-    print(f"Error: Unsupported TTS provider: {TTS_CONFIG['provider']}")
+    logger.error(f"Error: Unsupported TTS provider: {TTS_CONFIG['provider']}")
     exit(1)
 
+# Provider clients are created on first use and shared by every segment (and worker thread),
+# so the underlying HTTP/gRPC connection pools are reused instead of re-handshaking per segment
+_EL_CLIENT = None
+_GC_CLIENT = None
+_OAI_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
+def _get_elevenlabs():
+    global _EL_CLIENT
+    with _CLIENT_LOCK:
+        if _EL_CLIENT is None:
+            _EL_CLIENT = ElevenLabs(api_key=os.environ["ELEVEN_API_KEY"])
+        return _EL_CLIENT
+
+def _get_google():
+    global _GC_CLIENT
+    with _CLIENT_LOCK:
+        if _GC_CLIENT is None:
+            _GC_CLIENT = texttospeech.TextToSpeechClient()
+        return _GC_CLIENT
+
+def _get_openai():
+    global _OAI_CLIENT
+    with _CLIENT_LOCK:
+        if _OAI_CLIENT is None:
+            _OAI_CLIENT = openai.OpenAI(api_key=OPENAI_API_KEY)
+        return _OAI_CLIENT
+
+def list_existing_files(directory):
+    """Return the set of file names in a directory (one readdir instead of a stat per file)"""
+    try:
+        return set(os.listdir(directory))
+    except FileNotFoundError:
+        return set()
+
+SCRIPTS_PATH = os.path.join('generated', 'weather_scripts.json')
+
 def load_weather_scripts():
     """Load weather scripts from generated/weather_scripts.json"""
-    scripts_path = os.path.join('generated', 'weather_scripts.json')
+    scripts_path = SCRIPTS_PATH
     if not os.path.exists(scripts_path):
-        print(f"Error: {scripts_path} not found!")
-        print("Please run step2_weather_scripts.py first to generate weather scripts.")
+        logger.error(f"Error: {scripts_path} not found!")
+        logger.error("Please run step2_weather_scripts.py first to generate weather scripts.")
         return None
     
-    with open(scripts_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    if orjson is not None:
+        with open(scripts_path, 'rb') as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(scripts_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
     
     # Extract scripts array from the weather data structure
     scripts = data.get('scripts', [])
-    print(f"Loaded {len(scripts)} weather script segments from {scripts_path}")
+    logger.info(f"Loaded {len(scripts)} weather script segments from {scripts_path}")
     return scripts
 
+def annotate_segments(scripts, audio_dir):
+    """Precompute each segment's id, audio filename and audio path once for all later loops"""
+    audio_dir_prefix = audio_dir + os.sep
+    for segment in scripts:
+        segment_id = f"{segment['segment_type']}_{segment.get('display_order', 0)}"
+        segment['_segment_id'] = segment_id
+        segment['_audio_filename'] = f"{segment_id}.mp3"
+        segment['_audio_path'] = f"{audio_dir_prefix}{segment_id}.mp3"
+    return scripts
+
+# Filipino pronunciation replacements (from news config), built once at import time and read-only
+_FIL_REPLACEMENTS = MappingProxyType({
+    "Pulilan, Bulacan": "Pulilan",
+    "Brgy.": "Barangay",
+    "Brgy": "Barangay",
+    "Ms.": "Miss",
+    "Mr.": "Mister", 
+    "Mrs.": "Missis",
+    "Dr.": "Doctor",
+    "Sto.": "Santo",
+    "Sta.": "Santa",
+    "St.": "Street",
+    "Ave.": "Avenue",
+    "AM": "ng umaga",
+    "PM": "ng hapon",
+    "km": "kilometro",
+    "kg": "kilo",
+    "PHP": "peso",
+    "USD": "US dollar",
+    "&": "at",
+    "%": "porsyento",
+    "No.": "numero",
+    "°C": " degrees Celsius",
+    "°F": " degrees Fahrenheit",
+    "km/h": " kilometers per hour",
+    "mph": " miles per hour",
+    "UV": "U V",
+    "COVID-19": "COVID nineteen",
+    "24/7": "dalawampu't apat na oras",
+    "911": "nine-one-one",
+    """: '"',
+    """: '"', 
+    "'": "'",
+    "'": "'",
+    "…": "...",
+    "–": "-",
+    "—": "-",
+    "₱": "piso ",
+})
+
+# Longer phrases first to avoid partial replacements
+# One alternation for the whole table; longer phrases are listed first so they win over partial matches
+_FIL_REPLACEMENTS_RE = re.compile('|'.join(
+    re.escape(original) for original in sorted(_FIL_REPLACEMENTS, key=len, reverse=True)
+))
+
+# Enhanced pauses for better pacing: sentence ends get "...", clause breaks and "ng" get ".."
+_PAUSE_RE = re.compile(r'([.!?]) |([,;]) |ng ')
+
+# Pattern: "123 Street Name, Barangay Name, City Name"
+_ADDRESS_RE = re.compile(r'(\d+)\s+([^,]+),\s*(Brgy\.?\s*|Barangay\s*)([^,]+),\s*([^,]+)')
+
+def _insert_pause(match):
+    if match.group(1):
+        return f"{match.group(1)} ... "
+    if match.group(2):
+        return f"{match.group(2)} .. "
+    return "ng .. "
+
 def preprocess_script_for_tts(script_text, language):
     """Preprocess script text for better TTS pronunciation using news-style processing"""
-    import html
-    import codecs
-    import re
-    
     # First, fix Unicode encoding issues
     processed_text = script_text.strip()
     
-    # Fix Unicode escape sequences like \u00f1
-    try:
-        processed_text = codecs.decode(processed_text, 'unicode_escape')
-    except:
+    # Decode escape sequences like \u00f1, \n or \N{...} (only when the text contains a backslash)
+    if '\\' in processed_text:
         try:
-            processed_text = processed_text.encode().decode('unicode_escape')
-        except:
+            # backslashreplace keeps non-Latin-1 characters intact through the round trip
+            processed_text = processed_text.encode('latin-1', 'backslashreplace').decode('unicode_escape')
+        except UnicodeDecodeError:
             pass  # Keep original if decoding fails
     
-    # Also try HTML entity decoding
-    try:
+    # Also decode HTML entities such as &amp; (html.unescape also accepts some without a trailing ';')
+    if '&' in processed_text:
         processed_text = html.unescape(processed_text)
-    except:
-        pass
     
     if language.lower() == "filipino":
-        print(f"Applying comprehensive Filipino text preprocessing for better TTS")
-        
-        # Enhanced Filipino text processing (from news config)
-        filipino_replacements = {
-            "Pulilan, Bulacan": "Pulilan",
-            "Brgy.": "Barangay",
-            "Brgy": "Barangay",
-            "Ms.": "Miss",
-            "Mr.": "Mister", 
-            "Mrs.": "Missis",
-            "Dr.": "Doctor",
-            "Sto.": "Santo",
-            "Sta.": "Santa",
-            "St.": "Street",
-            "Ave.": "Avenue",
-            "AM": "ng umaga",
-            "PM": "ng hapon",
-            "km": "kilometro",
-            "kg": "kilo",
-            "PHP": "peso",
-            "USD": "US dollar",
-            "&": "at",
-            "%": "porsyento",
-            "No.": "numero",
-            "°C": " degrees Celsius",
-            "°F": " degrees Fahrenheit",
-            "km/h": " kilometers per hour",
-            "mph": " miles per hour",
-            "UV": "U V",
-            "COVID-19": "COVID nineteen",
-            "24/7": "dalawampu't apat na oras",
-            "911": "nine-one-one",
-            """: '"',
-            """: '"', 
-            "'": "'",
-            "'": "'",
-            "…": "...",
-            "–": "-",
-            "—": "-",
-            "₱": "piso ",
-        }
-        
-        # Apply replacements in order (longer phrases first to avoid partial replacements)
-        sorted_replacements = sorted(filipino_replacements.items(), key=lambda x: len(x[0]), reverse=True)
-        for original, replacement in sorted_replacements:
-            processed_text = processed_text.replace(original, replacement)
+        # Apply all replacements in a single pass (longer phrases first to avoid partial replacements)
+        processed_text = _FIL_REPLACEMENTS_RE.sub(lambda m: _FIL_REPLACEMENTS[m.group(0)], processed_text)
         
         # Enhanced pauses for better pacing
-        processed_text = processed_text.replace(". ", ". ... ")
-        processed_text = processed_text.replace("! ", "! ... ")
-        processed_text = processed_text.replace("? ", "? ... ")
-        processed_text = processed_text.replace(", ", ", .. ")
-        processed_text = processed_text.replace("; ", "; .. ")
-        processed_text = processed_text.replace("ng ", "ng .. ")
+        processed_text = _PAUSE_RE.sub(_insert_pause, processed_text)
         
         # Address pattern improvements
-        # Pattern: "123 Street Name, Barangay Name, City Name"
         # Replace with: "Street Name sa Barangay Name, City Name"
-        processed_text = re.sub(
-            r'(\d+)\s+([^,]+),\s*(Brgy\.?\s*|Barangay\s*)([^,]+),\s*([^,]+)',
-            r'\2 sa Barangay \4, \5',
-            processed_text
-        )
+        processed_text = _ADDRESS_RE.sub(r'\2 sa Barangay \4, \5', processed_text)
     
     return processed_text
 
+def _log_preview(processed_script, n=100):
+    """Log the start of a preprocessed script; formatting is skipped unless DEBUG is enabled"""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Preprocessed script: %s%s", processed_script[:n], "..." if len(processed_script) > n else "")
+
+def _cache_key(text, cfg):
+    """SHA-256 of the preprocessed script plus every provider setting that affects the render"""
+    return hashlib.sha256(json.dumps([text, cfg], sort_keys=True).encode()).hexdigest()
+
+# Set by --force to re-render every segment instead of reusing cached audio
+_force_regenerate = False
+
+def _load_cached_audio(cache_key, audio_path, extension="mp3"):
+    """Copy a cached render to audio_path and return its stored duration, or None on a miss"""
+    if _force_regenerate:
+        return None
+    
+    cached_path = os.path.join(AUDIO_CACHE_DIR, f"{cache_key}.{extension}")
+    sidecar_path = os.path.join(AUDIO_CACHE_DIR, f"{cache_key}.json")
+    if not (os.path.exists(cached_path) and os.path.exists(sidecar_path)):
+        return None
+    
+    with open(sidecar_path, "r", encoding="utf-8") as f:
+        duration = json.load(f)["duration"]
+    shutil.copy(cached_path, audio_path)
+    logger.info(f"Reusing cached audio (script unchanged): {cached_path}")
+    return duration
+
+def _store_cached_audio(cache_key, audio_path, duration, extension="mp3"):
+    """Keep a copy of a fresh render and its measured duration for future runs"""
+    os.makedirs(AUDIO_CACHE_DIR, exist_ok=True)
+    shutil.copy(audio_path, os.path.join(AUDIO_CACHE_DIR, f"{cache_key}.{extension}"))
+    with open(os.path.join(AUDIO_CACHE_DIR, f"{cache_key}.json"), "w", encoding="utf-8") as f:
+        json.dump({"duration": duration}, f)
+
+def _build_result(segment, audio_filename, audio_path, duration, voice, service):
+    """Build the manifest entry for a generated segment"""
+    # Get associated media files
+    media_files = get_media_files_for_segment(segment["segment_type"])
+    
+    result = {
+        "segment_type": segment["segment_type"],
+        "display_name": segment["display_name"],
+        "audio_file": audio_filename,
+        "audio_path": audio_path,
+        "script": segment["script"],
+        "headline": segment.get("headline", ""),
+        "duration": round(duration, 3),
+        "language": LANGUAGE,
+        "voice_used": voice,
+        "tts_service": service
+    }
+    
+    # Add media information if available
+    if media_files:
+        result["media"] = media_files
+        
+    return result
+
+# HTTP statuses worth retrying: rate limiting and transient server errors
+RETRYABLE_TTS_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+def _is_retryable_tts_error(error):
+    """True for rate-limit, server and connection errors from any TTS provider"""
+    # ElevenLabs errors carry status_code; google.api_core errors carry an HTTP code
+    status = getattr(error, 'status_code', None) or getattr(error, 'code', None)
+    if isinstance(status, int):
+        return status in RETRYABLE_TTS_STATUSES
+    return isinstance(error, (ConnectionError, TimeoutError))
+
+def _call_with_retry(call, description):
+    """Run one TTS request, retrying transient failures with jittered exponential backoff"""
+    attempts = max(1, TTS_CONFIG["retry"]["attempts"])
+    delay = TTS_CONFIG["retry"]["delay"] / 1000.0
+    for attempt in range(1, attempts + 1):
+        try:
+            return call()
+        except Exception as e:
+            if attempt == attempts or not _is_retryable_tts_error(e):
+                raise
+            # Jitter keeps the concurrent workers from retrying in lockstep
+            wait = delay * 2 ** (attempt - 1) * random.uniform(1.0, 1.5)
+            logger.warning(f"⚠️  {description} failed ({e}); retrying in {wait:.1f}s (attempt {attempt + 1}/{attempts})")
+            time.sleep(wait)
+
 def generate_audio_with_elevenlabs_tts(segment, output_dir):
     """Generate audio file using ElevenLabs Text-to-Speech"""
-    print(f"Generating audio with ElevenLabs TTS for: {segment['display_name']}")
-    print(f"Language: {LANGUAGE}")
-    print(f"Script length: {len(segment['script'])} characters")
+    logger.info(f"Generating audio with ElevenLabs TTS for: {segment['display_name']}")
+    logger.info(f"Language: {LANGUAGE}")
+    logger.info(f"Script length: {len(segment['script'])} characters")
     
     # Create audio output directory
     os.makedirs(output_dir, exist_ok=True)
     
     # Output filename - use unique identifier to avoid overwriting
-    segment_id = f"{segment['segment_type']}_{segment.get('display_order', 0)}"
-    audio_filename = f"{segment_id}.mp3"
+    audio_filename = segment['_audio_filename']
     audio_path = os.path.join(output_dir, audio_filename)
     
     try:
@@ -239,236 +458,278 @@ def generate_audio_with_elevenlabs_tts(segment, output_dir):
         
         # Preprocess script for better TTS pronunciation
         processed_script = preprocess_script_for_tts(segment["script"], LANGUAGE)
-        print(f"Preprocessed script: {processed_script[:100]}..." if len(processed_script) > 100 else processed_script)
-        
-        # Initialize ElevenLabs client
-        client = ElevenLabs(api_key=api_key)
-        
-        # Configure voice settings
-        voice_settings = VoiceSettings(
-            stability=TTS_CONFIG["elevenlabs"]["voice_settings"]["stability"],
-            similarity_boost=TTS_CONFIG["elevenlabs"]["voice_settings"]["similarity_boost"],
-            style=TTS_CONFIG["elevenlabs"]["voice_settings"]["style"],
-            use_speaker_boost=TTS_CONFIG["elevenlabs"]["voice_settings"]["use_speaker_boost"]
-        )
-        
-        print(f"Using voice ID: {TTS_CONFIG['elevenlabs']['voice_id']}")
-        print(f"Using model: {TTS_CONFIG['elevenlabs']['model_id']}")
-        
-        # Generate the speech using the correct API
-        audio_data = client.text_to_speech.convert(
-            text=processed_script,
-            voice_id=TTS_CONFIG["elevenlabs"]["voice_id"],
-            model_id=TTS_CONFIG["elevenlabs"]["model_id"],
-            voice_settings=voice_settings,
-            output_format=TTS_CONFIG["elevenlabs"]["output_format"]
-        )
-        
-        # Save audio file
-        with open(audio_path, "wb") as f:
-            # audio_data is a generator, so we need to iterate through it
-            for chunk in audio_data:
-                f.write(chunk)
-        
-        print(f"Audio saved: {audio_path}")
-        
-        # Measure actual duration of generated audio file
-        try:
-            audio_segment = AudioSegment.from_file(audio_path)
-            actual_duration = len(audio_segment) / 1000.0  # Convert to seconds
-            print(f"Measured actual duration: {actual_duration:.3f}s (estimated: {segment['duration']}s)")
-        except Exception as e:
-            print(f"Warning: Could not measure audio duration: {e}")
-            actual_duration = segment["duration"]  # Fallback to estimated
-        
-        # Get associated media files
-        media_files = get_media_files_for_segment(segment["segment_type"])
-        
-        result = {
-            "segment_type": segment["segment_type"],
-            "display_name": segment["display_name"],
-            "audio_file": audio_filename,
-            "audio_path": audio_path,
-            "script": segment["script"],
-            "headline": segment.get("headline", ""),
-            "duration": round(actual_duration, 3),
-            "language": LANGUAGE,
-            "voice_used": TTS_CONFIG["elevenlabs"]["voice_id"],
-            "tts_service": "ElevenLabs"
-        }
+        _log_preview(processed_script)
+        
+        cache_key = _cache_key(processed_script, {
+            "provider": "elevenlabs",
+            "voice_id": TTS_CONFIG["elevenlabs"]["voice_id"],
+            "model_id": TTS_CONFIG["elevenlabs"]["model_id"],
+            "voice_settings": TTS_CONFIG["elevenlabs"]["voice_settings"],
+            "output_format": TTS_CONFIG["elevenlabs"]["output_format"]
+        })
+        actual_duration = _load_cached_audio(cache_key, audio_path)
         
-        # Add media information if available
-        if media_files:
-            result["media"] = media_files
+        if actual_duration is None:
+            # Shared ElevenLabs client
+            client = _get_elevenlabs()
+            
+            # Configure voice settings
+            voice_settings = VoiceSettings(
+                stability=TTS_CONFIG["elevenlabs"]["voice_settings"]["stability"],
+                similarity_boost=TTS_CONFIG["elevenlabs"]["voice_settings"]["similarity_boost"],
+                style=TTS_CONFIG["elevenlabs"]["voice_settings"]["style"],
+                use_speaker_boost=TTS_CONFIG["elevenlabs"]["voice_settings"]["use_speaker_boost"]
+            )
+            
+            logger.info(f"Using voice ID: {TTS_CONFIG['elevenlabs']['voice_id']}")
+            logger.info(f"Using model: {TTS_CONFIG['elevenlabs']['model_id']}")
+            
+            # Generate the speech; the streaming endpoint starts returning bytes before synthesis finishes
+            if TTS_CONFIG["elevenlabs"].get("streaming", True):
+                synthesize = client.text_to_speech.stream
+            else:
+                synthesize = client.text_to_speech.convert
+            
+            def synthesize_to_file():
+                audio_data = synthesize(
+                    text=processed_script,
+                    voice_id=TTS_CONFIG["elevenlabs"]["voice_id"],
+                    model_id=TTS_CONFIG["elevenlabs"]["model_id"],
+                    voice_settings=voice_settings,
+                    output_format=TTS_CONFIG["elevenlabs"]["output_format"]
+                )
+                
+                # Save audio file; audio_data is a generator of chunks, coalesced through a 1 MiB buffer
+                with open(audio_path, "wb", buffering=1 << 20) as f:
+                    f.writelines(audio_data)
             
-        return result
+            # A streamed response can also fail mid-file, so each retry rewrites the whole file
+            _call_with_retry(synthesize_to_file, f"ElevenLabs TTS for {segment['segment_type']}")
+            
+            logger.info(f"Audio saved: {audio_path}")
+            
+            # Measure actual duration of generated audio file
+            try:
+                actual_duration = _probe_duration(audio_path)
+                logger.info(f"Measured actual duration: {actual_duration:.3f}s (estimated: {segment['duration']}s)")
+                _store_cached_audio(cache_key, audio_path, actual_duration)
+            except Exception as e:
+                logger.warning(f"Warning: Could not measure audio duration: {e}")
+                actual_duration = segment["duration"]  # Fallback to estimated
+        
+        return _build_result(segment, audio_filename, audio_path, actual_duration, TTS_CONFIG["elevenlabs"]["voice_id"], "ElevenLabs")
         
     except Exception as e:
-        print(f"Error generating audio with ElevenLabs TTS for {segment['segment_type']}: {e}")
+        logger.error(f"Error generating audio with ElevenLabs TTS for {segment['segment_type']}: {e}")
         return None
 
 def generate_audio_with_google_tts(segment, output_dir):
     """Generate audio file using Google Cloud Text-to-Speech"""
-    print(f"Generating audio with Google TTS for: {segment['display_name']}")
-    print(f"Language: {LANGUAGE}")
-    print(f"Script length: {len(segment['script'])} characters")
+    logger.info(f"Generating audio with Google TTS for: {segment['display_name']}")
+    logger.info(f"Language: {LANGUAGE}")
+    logger.info(f"Script length: {len(segment['script'])} characters")
     
     # Create audio output directory
     os.makedirs(output_dir, exist_ok=True)
     
     # Output filename - use unique identifier to avoid overwriting
-    segment_id = f"{segment['segment_type']}_{segment.get('display_order', 0)}"
+    segment_id = segment['_segment_id']
     audio_filename = f"{segment_id}.{TTS_CONFIG['google']['output_format']}"
     audio_path = os.path.join(output_dir, audio_filename)
     
     try:
         # Preprocess script for better TTS pronunciation
         processed_script = preprocess_script_for_tts(segment["script"], LANGUAGE)
-        print(f"Preprocessed script: {processed_script[:100]}..." if len(processed_script) > 100 else processed_script)
-        
-        # Initialize Google Cloud TTS client
-        client = texttospeech.TextToSpeechClient()
-        
-        # Configure the text input
-        synthesis_input = texttospeech.SynthesisInput(text=processed_script)
-        
-        # Configure the voice parameters
-        voice = texttospeech.VoiceSelectionParams(
-            language_code=TTS_CONFIG["google"]["language_code"],
-            name=TTS_CONFIG["google"]["voice_name"],
-            ssml_gender=getattr(texttospeech.SsmlVoiceGender, TTS_CONFIG["google"]["voice_gender"])
-        )
-        
-        # Configure the audio output
-        audio_config = texttospeech.AudioConfig(
-            audio_encoding=getattr(texttospeech.AudioEncoding, TTS_CONFIG["google"]["audio_encoding"]),
-            speaking_rate=TTS_CONFIG["google"]["speaking_rate"],
-            pitch=TTS_CONFIG["google"]["pitch"]
-        )
-        
-        # Generate the speech
-        response = client.synthesize_speech(
-            input=synthesis_input, 
-            voice=voice, 
-            audio_config=audio_config
-        )
-        
-        # Save audio file
-        with open(audio_path, "wb") as out:
-            out.write(response.audio_content)
-        
-        print(f"Audio saved: {audio_path}")
-        
-        # Measure actual duration of generated audio file
-        try:
-            audio_segment = AudioSegment.from_file(audio_path)
-            actual_duration = len(audio_segment) / 1000.0  # Convert to seconds
-            print(f"Measured actual duration: {actual_duration:.3f}s (estimated: {segment['duration']}s)")
-        except Exception as e:
-            print(f"Warning: Could not measure audio duration: {e}")
-            actual_duration = segment["duration"]  # Fallback to estimated
-        
-        # Get associated media files
-        media_files = get_media_files_for_segment(segment["segment_type"])
-        
-        result = {
-            "segment_type": segment["segment_type"],
-            "display_name": segment["display_name"],
-            "audio_file": audio_filename,
-            "audio_path": audio_path,
-            "script": segment["script"],
-            "headline": segment.get("headline", ""),
-            "duration": round(actual_duration, 3),
-            "language": LANGUAGE,
-            "voice_used": TTS_CONFIG["google"]["voice_name"],
-            "tts_service": "Google Cloud"
-        }
+        _log_preview(processed_script)
+        
+        output_format = TTS_CONFIG["google"]["output_format"]
+        cache_key = _cache_key(processed_script, {
+            "provider": "google",
+            "language_code": TTS_CONFIG["google"]["language_code"],
+            "voice_name": TTS_CONFIG["google"]["voice_name"],
+            "voice_gender": TTS_CONFIG["google"]["voice_gender"],
+            "audio_encoding": TTS_CONFIG["google"]["audio_encoding"],
+            "speaking_rate": TTS_CONFIG["google"]["speaking_rate"],
+            "pitch": TTS_CONFIG["google"]["pitch"],
+            "output_format": output_format
+        })
+        actual_duration = _load_cached_audio(cache_key, audio_path, output_format)
         
-        # Add media information if available
-        if media_files:
-            result["media"] = media_files
+        if actual_duration is None:
+            # Shared Google Cloud TTS client
+            client = _get_google()
+            
+            # Configure the text input
+            synthesis_input = texttospeech.SynthesisInput(text=processed_script)
+            
+            # Configure the voice parameters
+            voice = texttospeech.VoiceSelectionParams(
+                language_code=TTS_CONFIG["google"]["language_code"],
+                name=TTS_CONFIG["google"]["voice_name"],
+                ssml_gender=getattr(texttospeech.SsmlVoiceGender, TTS_CONFIG["google"]["voice_gender"])
+            )
+            
+            # Configure the audio output
+            audio_config = texttospeech.AudioConfig(
+                audio_encoding=getattr(texttospeech.AudioEncoding, TTS_CONFIG["google"]["audio_encoding"]),
+                speaking_rate=TTS_CONFIG["google"]["speaking_rate"],
+                pitch=TTS_CONFIG["google"]["pitch"]
+            )
+            
+            # Generate the speech
+            response = _call_with_retry(
+                lambda: client.synthesize_speech(
+                    input=synthesis_input, 
+                    voice=voice, 
+                    audio_config=audio_config
+                ),
+                f"Google TTS for {segment['segment_type']}"
+            )
             
-        return result
+            # Save audio file
+            with open(audio_path, "wb") as out:
+                out.write(response.audio_content)
+            
+            logger.info(f"Audio saved: {audio_path}")
+            
+            # Measure actual duration from the response bytes already in memory
+            try:
+                actual_duration = measure_audio_duration(response.audio_content, output_format)
+                logger.info(f"Measured actual duration: {actual_duration:.3f}s (estimated: {segment['duration']}s)")
+                _store_cached_audio(cache_key, audio_path, actual_duration, output_format)
+            except Exception as e:
+                logger.warning(f"Warning: Could not measure audio duration: {e}")
+                actual_duration = segment["duration"]  # Fallback to estimated
+        
+        return _build_result(segment, audio_filename, audio_path, actual_duration, TTS_CONFIG["google"]["voice_name"], "Google Cloud")
         
     except Exception as e:
-        print(f"Error generating audio with Google TTS for {segment['segment_type']}: {e}")
+        logger.error(f"Error generating audio with Google TTS for {segment['segment_type']}: {e}")
         return None
 
-def generate_audio_with_openai_tts(segment, output_dir):
-    """Generate audio file using OpenAI Text-to-Speech"""
-    print(f"Generating audio with OpenAI TTS for: {segment['display_name']}")
-    print(f"Language: {LANGUAGE}")
-    print(f"Script length: {len(segment['script'])} characters")
+def _prepare_openai_request(segment, output_dir):
+    """Resolve voice, preprocessed script, output path and cache key for an OpenAI TTS segment"""
+    logger.info(f"Generating audio with OpenAI TTS for: {segment['display_name']}")
+    logger.info(f"Language: {LANGUAGE}")
+    logger.info(f"Script length: {len(segment['script'])} characters")
     
     # Create audio output directory
     os.makedirs(output_dir, exist_ok=True)
     
     # Output filename - use unique identifier to avoid overwriting
-    segment_id = f"{segment['segment_type']}_{segment.get('display_order', 0)}"
-    audio_filename = f"{segment_id}.mp3"
+    audio_filename = segment['_audio_filename']
     audio_path = os.path.join(output_dir, audio_filename)
     
+    # Select appropriate voice for language
+    voice = TTS_CONFIG["openai"]["voice"]
+    if LANGUAGE.lower() == "filipino":
+        # Use alloy voice which works well with Filipino
+        # OpenAI TTS doesn't have specific Filipino voices yet, but alloy handles it reasonably
+        voice = "alloy"
+        logger.info(f"Using voice '{voice}' for Filipino language")
+    
+    # Preprocess script for better TTS pronunciation
+    processed_script = preprocess_script_for_tts(segment["script"], LANGUAGE)
+    _log_preview(processed_script)
+    
+    model = TTS_CONFIG["openai"]["model"]
+    speed = TTS_CONFIG["openai"]["speed"]
+    
+    return {
+        "audio_filename": audio_filename,
+        "audio_path": audio_path,
+        "cache_key": _cache_key(processed_script, {
+            "provider": "openai",
+            "voice": voice,
+            "model": model,
+            "speed": speed,
+            "output_format": "mp3"
+        }),
+        "voice": voice,
+        "model": model,
+        "speed": speed,
+        "processed_script": processed_script
+    }
+
+def _measure_openai_audio(segment, request, audio_bytes):
+    """Measure a fresh render and cache it, falling back to the estimated duration"""
+    logger.info(f"Audio saved: {request['audio_path']}")
+    
+    # Measure actual duration from the in-memory MP3 (no re-read)
+    try:
+        actual_duration = measure_audio_duration(audio_bytes)
+        logger.info(f"Measured actual duration: {actual_duration:.3f}s (estimated: {segment['duration']}s)")
+        _store_cached_audio(request["cache_key"], request["audio_path"], actual_duration)
+    except Exception as e:
+        logger.warning(f"Warning: Could not measure audio duration: {e}")
+        actual_duration = segment["duration"]  # Fallback to estimated
+    return actual_duration
+
+def generate_audio_with_openai_tts(segment, output_dir):
+    """Generate audio file using OpenAI Text-to-Speech"""
     try:
-        # Select appropriate voice for language
-        voice = TTS_CONFIG["openai"]["voice"]
-        if LANGUAGE.lower() == "filipino":
-            # Use alloy voice which works well with Filipino
-            # OpenAI TTS doesn't have specific Filipino voices yet, but alloy handles it reasonably
-            voice = "alloy"
-            print(f"Using voice '{voice}' for Filipino language")
+        request = _prepare_openai_request(segment, output_dir)
         
-        # Preprocess script for better TTS pronunciation
-        processed_script = preprocess_script_for_tts(segment["script"], LANGUAGE)
-        print(f"Preprocessed script: {processed_script[:100]}..." if len(processed_script) > 100 else processed_script)
-        
-        # OpenAI TTS API call
-        client = openai.OpenAI(api_key=OPENAI_API_KEY)
-        response = client.audio.speech.create(
-            model=TTS_CONFIG["openai"]["model"],
-            voice=voice,
-            input=processed_script,
-            speed=TTS_CONFIG["openai"]["speed"]
-        )
-        
-        # Save audio file
-        response.stream_to_file(audio_path)
-        print(f"Audio saved: {audio_path}")
-        
-        # Measure actual duration of generated audio file
-        try:
-            audio_segment = AudioSegment.from_file(audio_path)
-            actual_duration = len(audio_segment) / 1000.0  # Convert to seconds
-            print(f"Measured actual duration: {actual_duration:.3f}s (estimated: {segment['duration']}s)")
-        except Exception as e:
-            print(f"Warning: Could not measure audio duration: {e}")
-            actual_duration = segment["duration"]  # Fallback to estimated
-        
-        # Get associated media files
-        media_files = get_media_files_for_segment(segment["segment_type"])
-        
-        result = {
-            "segment_type": segment["segment_type"],
-            "display_name": segment["display_name"],
-            "audio_file": audio_filename,
-            "audio_path": audio_path,
-            "script": segment["script"],
-            "headline": segment.get("headline", ""),
-            "duration": round(actual_duration, 3),
-            "language": LANGUAGE,
-            "voice_used": voice,
-            "tts_service": "OpenAI"
-        }
+        actual_duration = _load_cached_audio(request["cache_key"], request["audio_path"])
+        if actual_duration is None:
+            # OpenAI TTS API call, writing chunks to disk as they arrive from the network
+            audio_buffer = bytearray()
+            with _get_openai().audio.speech.with_streaming_response.create(
+                model=request["model"],
+                voice=request["voice"],
+                input=request["processed_script"],
+                speed=request["speed"]
+            ) as response:
+                with open(request["audio_path"], "wb") as out:
+                    for chunk in response.iter_bytes(chunk_size=64 * 1024):
+                        out.write(chunk)
+                        audio_buffer += chunk
+            actual_duration = _measure_openai_audio(segment, request, bytes(audio_buffer))
         
-        # Add media information if available
-        if media_files:
-            result["media"] = media_files
-            
-        return result
+        return _build_result(segment, request["audio_filename"], request["audio_path"], actual_duration, request["voice"], "OpenAI")
+        
+    except Exception as e:
+        logger.error(f"Error generating audio with OpenAI TTS for {segment['segment_type']}: {e}")
+        return None
+
+async def generate_audio_with_openai_tts_async(segment, output_dir, aclient, semaphore):
+    """Generate audio file using OpenAI Text-to-Speech on a shared AsyncOpenAI client"""
+    try:
+        request = _prepare_openai_request(segment, output_dir)
+        
+        actual_duration = _load_cached_audio(request["cache_key"], request["audio_path"])
+        if actual_duration is None:
+            audio_buffer = bytearray()
+            # The semaphore keeps concurrent requests within OpenAI rate limits
+            async with semaphore:
+                async with aclient.audio.speech.with_streaming_response.create(
+                    model=request["model"],
+                    voice=request["voice"],
+                    input=request["processed_script"],
+                    speed=request["speed"]
+                ) as response:
+                    with open(request["audio_path"], "wb") as out:
+                        async for chunk in response.iter_bytes(chunk_size=64 * 1024):
+                            out.write(chunk)
+                            audio_buffer += chunk
+            actual_duration = _measure_openai_audio(segment, request, bytes(audio_buffer))
+        
+        return _build_result(segment, request["audio_filename"], request["audio_path"], actual_duration, request["voice"], "OpenAI")
         
     except Exception as e:
-        print(f"Error generating audio with OpenAI TTS for {segment['segment_type']}: {e}")
+        logger.error(f"Error generating audio with OpenAI TTS for {segment['segment_type']}: {e}")
         return None
 
+async def generate_openai_segments_async(scripts, output_dir):
+    """Generate all segments concurrently with AsyncOpenAI, keeping script order in the results"""
+    semaphore = asyncio.Semaphore(TTS_CONFIG["concurrency"])
+    async with AsyncOpenAI(api_key=OPENAI_API_KEY) as aclient:
+        results = await asyncio.gather(*[
+            generate_audio_with_openai_tts_async(segment, output_dir, aclient, semaphore)
+            for segment in scripts
+        ])
+    return [result for result in results if result]
+
 def generate_audio_segment(segment, output_dir):
     """Generate audio segment using the configured TTS provider"""
     if TTS_CONFIG['provider'] == 'elevenlabs':
@@ -478,112 +739,219 @@ def generate_audio_segment(segment, output_dir):
     elif TTS_CONFIG['provider'] == 'google':
         return generate_audio_with_google_tts(segment, output_dir)
     else:
-        print(f"Error: Unsupported TTS provider: {TTS_CONFIG['provider']}")
+        logger.error(f"Error: Unsupported TTS provider: {TTS_CONFIG['provider']}")
         return None
 
-def combine_audio_segments(audio_results, output_dir):
+def concat_audio_with_pyav(audio_paths, combined_path, pause_ms=1000):
+    """Concatenate MP3 files with PyAV, inserting silence between them.
+    
+    Every segment is decoded in-process into a float PCM buffer and the combined
+    MP3 is encoded in a single pass, instead of spawning ffmpeg once per segment
+    and once more for the export. Returns the combined duration in seconds.
+    """
+    pcm_chunks = []
+    sample_rate = None
+    layout = None
+    silence = None
+    
+    for audio_path in audio_paths:
+        with av.open(audio_path) as container:
+            stream = container.streams.audio[0]
+            if sample_rate is None:
+                # The first segment defines the output format
+                sample_rate = stream.rate
+                layout = stream.layout.name
+                silence = np.zeros((len(stream.layout.channels), sample_rate * pause_ms // 1000), dtype=np.float32)
+            else:
+                pcm_chunks.append(silence)
+            
+            resampler = av.AudioResampler(format='fltp', layout=layout, rate=sample_rate)
+            for frame in container.decode(stream):
+                for resampled in resampler.resample(frame):
+                    pcm_chunks.append(resampled.to_ndarray())
+            for resampled in resampler.resample(None):
+                pcm_chunks.append(resampled.to_ndarray())
+    
+    if not pcm_chunks:
+        raise ValueError("No audio data to combine")
+    
+    pcm = np.concatenate(pcm_chunks, axis=1)
+    
+    with av.open(combined_path, 'w', format='mp3') as output:
+        out_stream = output.add_stream('mp3', rate=sample_rate)
+        out_stream.layout = layout
+        frame = av.AudioFrame.from_ndarray(pcm, format='fltp', layout=layout)
+        frame.sample_rate = sample_rate
+        for packet in out_stream.encode(frame):
+            output.mux(packet)
+        for packet in out_stream.encode(None):
+            output.mux(packet)
+    
+    return pcm.shape[1] / sample_rate
+
+# Largest gap (seconds) between the combined file and the summed segment timings before warning
+COMBINED_DURATION_TOLERANCE = 0.1
+
+_PAUSE_1S = None
+
+def _get_pause_1s(frame_rate):
+    """1 second of silence at the segments' frame rate, built once so pydub never resamples it"""
+    global _PAUSE_1S
+    if _PAUSE_1S is None or _PAUSE_1S.frame_rate != frame_rate:
+        _PAUSE_1S = AudioSegment.silent(duration=1000, frame_rate=frame_rate)
+    return _PAUSE_1S
+
+def concat_audio_with_ffmpeg(audio_paths, combined_path, pause_ms=1000):
+    """Concatenate MP3 files with pauses between them in a single ffmpeg decode/encode pass.
+    
+    Each input is decoded, which drops its encoder delay and padding, and the pauses are
+    generated at the first segment's sample rate and channel layout. The combined file is
+    therefore exactly the segment durations plus the pauses, unlike a stream copy.
+    """
+    info = MP3(audio_paths[0]).info
+    channel_layout = 'mono' if info.channels == 1 else 'stereo'
+    pause_seconds = pause_ms / 1000.0
+    
+    input_args = []
+    filters = []
+    concat_inputs = []
+    for i, audio_path in enumerate(audio_paths):
+        input_args += ['-i', audio_path]
+        filters.append(f"[{i}:a]aformat=sample_rates={info.sample_rate}:channel_layouts={channel_layout}[a{i}]")
+        if i > 0:
+            filters.append(f"anullsrc=r={info.sample_rate}:cl={channel_layout},atrim=duration={pause_seconds}[p{i}]")
+            concat_inputs.append(f"[p{i}]")
+        concat_inputs.append(f"[a{i}]")
+    filters.append(f"{''.join(concat_inputs)}concat=n={len(concat_inputs)}:v=0:a=1[out]")
+    
+    subprocess.run([
+        'ffmpeg', '-y', '-v', 'error', *input_args,
+        '-filter_complex', ';'.join(filters), '-map', '[out]',
+        '-c:a', 'libmp3lame', '-b:a', f"{info.bitrate // 1000}k",
+        combined_path
+    ], check=True)
+
+def combine_audio_segments(audio_results, output_dir, display_order_map):
     """Combine all audio segments into a single combined_weather.mp3 file"""
-    print("\n=== Combining Weather Audio Segments ===")
+    logger.info("\n=== Combining Weather Audio Segments ===")
     
     if not audio_results:
-        print("No audio files to combine!")
+        logger.info("No audio files to combine!")
         return None
     
-    # Load the original scripts to get display_order
-    scripts = load_weather_scripts()
-    if not scripts:
-        print("Error: Could not load scripts to determine display order!")
-        return None
-    
-    # Create a mapping of segment_type to display_order
-    display_order_map = {}
-    for script in scripts:
-        display_order_map[script['segment_type']] = script.get('display_order', 999)
-    
     # Sort audio results by display_order using the mapping
     segment_order = []
     for result in audio_results:
         segment_type = result['segment_type']
         display_order = display_order_map.get(segment_type, 999)
         segment_order.append((display_order, result))
-        print(f"  Found segment: {segment_type} with display_order: {display_order}")
+        logger.info(f"  Found segment: {segment_type} with display_order: {display_order}")
     
     # Sort by display_order
     segment_order.sort(key=lambda x: x[0])
     
-    print(f"Weather segments will be combined in this order:")
+    logger.info(f"Weather segments will be combined in this order:")
     for order, result in segment_order:
-        print(f"  {order}: {result['display_name']} ({result['segment_type']})")
+        logger.info(f"  {order}: {result['display_name']} ({result['segment_type']})")
     
     try:
-        combined_audio = AudioSegment.empty()
+        combined_path = os.path.join(output_dir, "combined_weather.mp3")
+        ordered_paths = []
         total_duration = 0
+        existing_files = list_existing_files(output_dir)
         
-        print("Combining weather segments in order:")
+        logger.info("Combining weather segments in order:")
         for order, result in segment_order:
             audio_path = result['audio_path']
             display_name = result['display_name']
             
-            if os.path.exists(audio_path):
-                print(f"  {order}: {display_name} - {audio_path}")
-                
-                # Load audio segment
-                audio_segment = AudioSegment.from_mp3(audio_path)
-                
-                # Add a small pause between segments (1 second)
-                if len(combined_audio) > 0:
-                    pause = AudioSegment.silent(duration=1000)  # 1 second pause
-                    combined_audio += pause
-                
-                # Add the audio segment
-                combined_audio += audio_segment
-                total_duration += len(audio_segment) / 1000.0  # Convert to seconds
-                
+            if result['audio_file'] in existing_files:
+                logger.info(f"  {order}: {display_name} - {audio_path}")
+                ordered_paths.append(audio_path)
+                total_duration += result['duration']
             else:
-                print(f"  WARNING: Audio file not found: {audio_path}")
+                logger.warning(f"  WARNING: Audio file not found: {audio_path}")
         
-        # Export combined audio
-        combined_path = os.path.join(output_dir, "combined_weather.mp3")
-        combined_audio.export(combined_path, format="mp3")
+        try:
+            # One ffmpeg pass decodes every segment, inserts the pauses and encodes once
+            concat_audio_with_ffmpeg(ordered_paths, combined_path)
+        except Exception as e:
+            logger.warning(f"⚠️  ffmpeg concat failed, re-encoding instead: {e}")
+            if av is not None:
+                # Decode every segment in-process and encode the combined file once
+                concat_audio_with_pyav(ordered_paths, combined_path)
+            else:
+                combined_audio = AudioSegment.empty()
+                for audio_path in ordered_paths:
+                    # Load audio segment
+                    audio_segment = AudioSegment.from_mp3(audio_path)
+                    
+                    # Add a small pause between segments (1 second)
+                    if len(combined_audio) > 0:
+                        combined_audio += _get_pause_1s(audio_segment.frame_rate)
+                    
+                    # Add the audio segment
+                    combined_audio += audio_segment
+                
+                # Export combined audio
+                combined_audio.export(combined_path, format="mp3")
         
-        # Measure actual combined duration
-        actual_combined_duration = len(combined_audio) / 1000.0  # Convert to seconds
+        # Segment timings assume fixed 1 second pauses; the decode/encode concat keeps the file to that timeline
+        pause_total = max(0, len(ordered_paths) - 1) * 1.0
+        expected_duration = total_duration + pause_total
         
-        print(f"\n✅ Combined weather audio created: {combined_path}")
-        print(f"📊 Measured combined duration: {actual_combined_duration:.3f} seconds ({actual_combined_duration/60:.2f} minutes)")
-        print(f"📊 Sum of segments: {total_duration:.3f} seconds (difference: {actual_combined_duration - total_duration:.3f}s)")
-        print(f"🎵 Total segments: {len(segment_order)}")
+        # Record what the combined file actually holds, read from its header
+        actual_combined_duration = _probe_duration(combined_path)
+        
+        logger.info(f"\n✅ Combined weather audio created: {combined_path}")
+        logger.info(f"📊 Combined duration: {actual_combined_duration:.3f} seconds ({actual_combined_duration/60:.2f} minutes)")
+        logger.info(f"📊 Sum of segments: {total_duration:.3f} seconds + {pause_total:.1f}s of pauses")
+        
+        drift = actual_combined_duration - expected_duration
+        if abs(drift) > COMBINED_DURATION_TOLERANCE:
+            logger.warning(f"⚠️  Combined audio is {drift:+.3f}s off the segment timings ({expected_duration:.3f}s expected); manifest start/end times may drift")
+        
+        logger.info(f"🎵 Total segments: {len(segment_order)}")
         
         return {
             "combined_file": "combined_weather.mp3",
             "combined_path": combined_path,
             "total_duration": round(actual_combined_duration, 3),
+            "expected_duration": round(expected_duration, 3),
             "segment_count": len(segment_order),
             "segments_included": [result['display_name'] for _, result in segment_order]
         }
         
     except Exception as e:
-        print(f"❌ Error combining weather audio segments: {e}")
+        logger.error(f"❌ Error combining weather audio segments: {e}")
         return None
 
+def measure_existing_audio_duration(audio_path):
+    """Probe an existing audio file, returning (duration, error) so it can run in a thread pool"""
+    try:
+        return _probe_duration(audio_path), None
+    except Exception as e:
+        return None, e
+
 def main():
     """Main function to generate weather TTS audio"""
-    import sys
+    global _force_regenerate
     
     # Check for combine-only flag
     combine_only = "--combine-only" in sys.argv or "-c" in sys.argv
+    _force_regenerate = "--force" in sys.argv
     
-    print("=== Nexcaster Weather TTS Generator ===")
+    logger.info("=== Nexcaster Weather TTS Generator ===")
     if combine_only:
-        print("Step 3: Combining existing weather audio files (SKIP GENERATION)")
+        logger.info("Step 3: Combining existing weather audio files (SKIP GENERATION)")
     else:
-        print("Step 3: Generating audio from weather scripts")
-    print(f"TTS Service: {TTS_CONFIG['provider']}")
-    print(f"Language: {LANGUAGE}")
-    print(f"Voice: {TTS_CONFIG['openai']['voice'] if TTS_CONFIG['provider'] == 'openai' else TTS_CONFIG['elevenlabs']['voice_id']}")
-    print(f"Speed: {TTS_CONFIG['openai']['speed'] if TTS_CONFIG['provider'] == 'openai' else TTS_CONFIG['elevenlabs']['voice_settings']['similarity_boost']}")
-    print(f"Output format: mp3")
-    print()
+        logger.info("Step 3: Generating audio from weather scripts")
+    logger.info(f"TTS Service: {TTS_CONFIG['provider']}")
+    logger.info(f"Language: {LANGUAGE}")
+    logger.info(f"Voice: {TTS_CONFIG['openai']['voice'] if TTS_CONFIG['provider'] == 'openai' else TTS_CONFIG['elevenlabs']['voice_id']}")
+    logger.info(f"Speed: {TTS_CONFIG['openai']['speed'] if TTS_CONFIG['provider'] == 'openai' else TTS_CONFIG['elevenlabs']['voice_settings']['similarity_boost']}")
+    logger.info(f"Output format: mp3")
+    logger.info("")
     
     # Load weather scripts
     scripts = load_weather_scripts()
@@ -592,66 +960,60 @@ def main():
     
     # Create audio output directory
     audio_dir = os.path.join('generated', 'audio')
+    annotate_segments(scripts, audio_dir)
+    
+    # Create a mapping of segment_type to display_order for combining
+    display_order_map = {script['segment_type']: script.get('display_order', 999) for script in scripts}
     
     # Generate audio for each segment (or skip if combine-only)
     audio_results = []
     if combine_only:
-        print("🔄 Skipping generation - looking for existing weather audio files...")
+        logger.info("🔄 Skipping generation - looking for existing weather audio files...")
         # Create audio_results from existing files
+        existing_files = list_existing_files(audio_dir)
+        
+        # Probe all existing files in parallel so ffprobe fallbacks overlap instead of running back to back
+        existing_paths = [segment['_audio_path'] for segment in scripts if segment['_audio_filename'] in existing_files]
+        measured = {}
+        if existing_paths:
+            with ThreadPoolExecutor(max_workers=min(16, len(existing_paths))) as executor:
+                measured = dict(zip(existing_paths, executor.map(measure_existing_audio_duration, existing_paths)))
+        
         for segment in scripts:
-            segment_id = f"{segment['segment_type']}_{segment.get('display_order', 0)}"
-            audio_filename = f"{segment_id}.mp3"
-            audio_path = os.path.join(audio_dir, audio_filename)
+            audio_filename = segment['_audio_filename']
+            audio_path = segment['_audio_path']
             
-            if os.path.exists(audio_path):
-                print(f"  ✅ Found: {audio_filename}")
+            if audio_filename in existing_files:
+                logger.info(f"  ✅ Found: {audio_filename}")
                 
-                # Measure actual duration of existing audio file
-                try:
-                    audio_segment = AudioSegment.from_file(audio_path)
-                    actual_duration = len(audio_segment) / 1000.0  # Convert to seconds
-                    print(f"    📏 Measured duration: {actual_duration:.3f}s (estimated was: {segment.get('duration', 0)}s)")
-                except Exception as e:
-                    print(f"    ⚠️  Warning: Could not measure audio duration: {e}")
+                actual_duration, error = measured[audio_path]
+                if error is None:
+                    logger.info(f"    📏 Measured duration: {actual_duration:.3f}s (estimated was: {segment.get('duration', 0)}s)")
+                else:
+                    logger.warning(f"    ⚠️  Warning: Could not measure audio duration: {error}")
                     actual_duration = segment.get("duration", 0)  # Fallback to estimated
                 
-                # Get associated media files
-                media_files = get_media_files_for_segment(segment["segment_type"])
-                
-                result = {
-                    "segment_type": segment["segment_type"],
-                    "display_name": segment["display_name"],
-                    "audio_file": audio_filename,
-                    "audio_path": audio_path,
-                    "script": segment["script"],
-                    "headline": segment.get("headline", ""),
-                    "duration": round(actual_duration, 3),
-                    "language": LANGUAGE,
-                    "voice_used": TTS_CONFIG['openai']['voice'] if TTS_CONFIG['provider'] == 'openai' else TTS_CONFIG['elevenlabs']['voice_id'],
-                    "tts_service": TTS_CONFIG['provider']
-                }
-                
-                # Add media information if available
-                if media_files:
-                    result["media"] = media_files
-                    
-                audio_results.append(result)
+                voice_used = TTS_CONFIG['openai']['voice'] if TTS_CONFIG['provider'] == 'openai' else TTS_CONFIG['elevenlabs']['voice_id']
+                audio_results.append(_build_result(segment, audio_filename, audio_path, actual_duration, voice_used, TTS_CONFIG['provider']))
             else:
-                print(f"  ❌ Missing: {audio_filename}")
+                logger.warning(f"  ❌ Missing: {audio_filename}")
+    elif TTS_CONFIG['provider'] == 'openai':
+        # Fan out all OpenAI requests concurrently on a single event loop
+        audio_results = asyncio.run(generate_openai_segments_async(scripts, audio_dir))
     else:
-        for segment in scripts:
-            result = generate_audio_segment(segment, audio_dir)
-            if result:
-                audio_results.append(result)
+        # Overlap the blocking provider calls across segments; map keeps script order
+        with ThreadPoolExecutor(max_workers=TTS_CONFIG["concurrency"]) as executor:
+            results = executor.map(lambda segment: generate_audio_segment(segment, audio_dir), scripts)
+            audio_results = [result for result in results if result]
     
     # Combine all audio segments into one file
-    combined_result = combine_audio_segments(audio_results, audio_dir)
+    combined_result = combine_audio_segments(audio_results, audio_dir, display_order_map)
     
     # Calculate start and end times for each segment
     cumulative_time = 0
     updated_audio_results = []
     
-    print("\n=== Calculating Weather Segment Timing (with 1s pauses) ===")
+    logger.info("\n=== Calculating Weather Segment Timing (with 1s pauses) ===")
     for i, result in enumerate(audio_results):
         start_time = cumulative_time
         end_time = start_time + result['duration']
@@ -661,7 +1023,7 @@ def main():
         updated_result['start_time'] = round(start_time, 3)
         updated_result['end_time'] = round(end_time, 3)
         
-        print(f"  {result['display_name']}: {start_time:.3f}s - {end_time:.3f}s (duration: {result['duration']:.3f}s)")
+        logger.info(f"  {result['display_name']}: {start_time:.3f}s - {end_time:.3f}s (duration: {result['duration']:.3f}s)")
         
         updated_audio_results.append(updated_result)
         cumulative_time = end_time
@@ -669,12 +1031,12 @@ def main():
         # Add 1-second pause after each segment (except the last one)
         if i < len(audio_results) - 1:
             cumulative_time += 1.0  # Add 1-second pause
-            print(f"    + 1.0s pause → next starts at {cumulative_time:.3f}s")
+            logger.info(f"    + 1.0s pause → next starts at {cumulative_time:.3f}s")
     
-    print(f"Total manifest duration with pauses: {cumulative_time:.3f}s ({cumulative_time/60:.2f} minutes)")
+    logger.info(f"Total manifest duration with pauses: {cumulative_time:.3f}s ({cumulative_time/60:.2f} minutes)")
     if combined_result:
-        print(f"Combined audio duration: {combined_result['total_duration']:.3f}s")
-        print(f"Timing match: {abs(cumulative_time - combined_result['total_duration']):.3f}s difference")
+        logger.info(f"Combined audio duration: {combined_result['total_duration']:.3f}s")
+        logger.info(f"Timing match: {abs(cumulative_time - combined_result['total_duration']):.3f}s difference")
     
     # Update metadata to include combined file info and timing
     final_metadata = {
@@ -694,27 +1056,31 @@ def main():
     
     # Save weather audio metadata
     weather_manifest_path = os.path.join('generated', 'weather_manifest.json')
-    with open(weather_manifest_path, 'w', encoding='utf-8') as f:
-        json.dump(final_metadata, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        with open(weather_manifest_path, 'wb') as f:
+            f.write(orjson.dumps(final_metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(weather_manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(final_metadata, f, indent=2, ensure_ascii=False)
     
-    print(f"\n🎯 Weather audio generation complete!")
-    print(f"Generated {len(updated_audio_results)} individual weather audio files in {LANGUAGE}")
-    print(f"Audio files saved in: {audio_dir}")
-    print(f"Manifest saved to: {weather_manifest_path}")
+    logger.info(f"\n🎯 Weather audio generation complete!")
+    logger.info(f"Generated {len(updated_audio_results)} individual weather audio files in {LANGUAGE}")
+    logger.info(f"Audio files saved in: {audio_dir}")
+    logger.info(f"Manifest saved to: {weather_manifest_path}")
     
     if combined_result:
-        print(f"\n🎵 Combined Weather Audio:")
-        print(f"  File: {combined_result['combined_file']}")
-        print(f"  Duration: {combined_result['total_duration']:.1f}s ({combined_result['total_duration']/60:.1f} minutes)")
-        print(f"  Segments: {combined_result['segment_count']}")
+        logger.info(f"\n🎵 Combined Weather Audio:")
+        logger.info(f"  File: {combined_result['combined_file']}")
+        logger.info(f"  Duration: {combined_result['total_duration']:.1f}s ({combined_result['total_duration']/60:.1f} minutes)")
+        logger.info(f"  Segments: {combined_result['segment_count']}")
     
     # Display summary of generated files with timing
-    print(f"\n📁 Generated weather audio segments with timing:")
+    logger.info(f"\n📁 Generated weather audio segments with timing:")
     for result in updated_audio_results:
         service_info = f"({result['tts_service']}: {result['voice_used']})"
         timing_info = f"[{result['start_time']:.1f}s - {result['end_time']:.1f}s]"
         headline_info = f"- \"{result['headline'][:50]}...\""
-        print(f"  - {result['display_name']}: {result['audio_file']} {timing_info} {service_info} {headline_info}")
+        logger.info(f"  - {result['display_name']}: {result['audio_file']} {timing_info} {service_info} {headline_info}")
 
 if __name__ == "__main__":
     main()
@@ -14,6 +14,7 @@ This module integrates with:
 Features:
 - Captures all weather card types defined in constants.py
 - Uniform 1200x800 video output
+- Native Playwright video recording, with a screenshot loop fallback (DEFAULT_CARD_CAPTURE_MODE)
 - WebM format optimized for composition
 - Simplified capture without external dependencies
 - Progress tracking and error handling
@@ -46,6 +47,9 @@ Library usage:
     
     # Capture specific cards
     videos = await recorder.capture_cards(['card-temperature', 'card-wind', 'card-humidity'])
+    
+    # Release the shared browser when done
+    await recorder.close()
 """
 
 import os
@@ -54,13 +58,15 @@ import asyncio
 import argparse
 import time
 import json
-import cv2
-import numpy as np
+import base64
+import functools
+import subprocess
+import queue
+import threading
+import aiohttp
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 from pathlib import Path
-from PIL import Image
-import io
 
 # Add parent directory to path for imports
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -68,7 +74,6 @@ sys.path.insert(0, parent_dir)
 
 from playwright.async_api import async_playwright
 from loguru import logger
-import requests
 
 # Import constants and configuration
 from constants import WEATHER_MEDIA_DESCRIPTIONS, get_description
@@ -79,6 +84,61 @@ WEATHER_CARD_DESCRIPTIONS = {k: v for k, v in WEATHER_MEDIA_DESCRIPTIONS.items()
 
 print(f"[CARD_RECORDER] Loaded {len(WEATHER_CARD_DESCRIPTIONS)} weather card types from constants")
 
+# Fallback card durations (seconds), overridden by DEFAULT_CARD_DURATIONS from config
+_DEFAULT_DURATIONS = {
+    'card-temperature': 6,
+    'card-feels-like': 5,
+    'card-cloud-cover': 5,
+    'card-precipitation': 7,
+    'card-wind': 6,
+    'card-humidity': 6,
+    'card-uv': 5,
+    'card-aqi': 5,
+    'card-visibility': 5,
+    'card-pressure': 6,
+    'card-sun': 6,
+    'card-moon': 5,
+    'card-current': 8,
+    'card-hourly': 10,
+    'weather_overview': 10,
+    'weather_current_overview': 8
+}
+_DURATIONS = {**_DEFAULT_DURATIONS, **(getattr(config, 'DEFAULT_CARD_DURATIONS', None) or {})}
+
+@functools.lru_cache(maxsize=None)
+def _card_filename(card_key: str) -> str:
+    return f"card-{card_key.replace('card-', '')}.webm"
+
+# Weather data endpoint the card pages load (relative to the Flask URL)
+WEATHER_DATA_PATH = 'api/weather/generated'
+
+# Set on the card element by weather_cards.html once data, charts and entry animations are done
+CARD_READY_SELECTOR = '#weatherCard[data-ready="1"]'
+
+# Seconds a successful Flask health check is trusted before checking again
+HEALTH_CHECK_TTL = 30
+
+VAAPI_DEVICE = '/dev/dri/renderD128'
+
+@functools.lru_cache(maxsize=1)
+def vaapi_vp9_available() -> bool:
+    """Check once whether ffmpeg can encode VP9 on a VAAPI render device"""
+    if not os.path.exists(VAAPI_DEVICE):
+        return False
+    try:
+        encoders = subprocess.run(['ffmpeg', '-hide_banner', '-encoders'], capture_output=True, text=True).stdout
+        if 'vp9_vaapi' not in encoders:
+            return False
+        # The encoder being built in says nothing about the GPU; many parts cannot encode VP9, so try one frame
+        probe = subprocess.run([
+            'ffmpeg', '-v', 'error', '-vaapi_device', VAAPI_DEVICE,
+            '-f', 'lavfi', '-i', 'color=black:s=64x64', '-frames:v', '1',
+            '-vf', 'format=nv12,hwupload', '-c:v', 'vp9_vaapi', '-f', 'null', '-'
+        ], capture_output=True, timeout=15)
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return probe.returncode == 0
+
 class WeatherCardRecorder:
     """Captures weather card videos from Flask interface for media composition"""
     
@@ -103,12 +163,41 @@ class WeatherCardRecorder:
         viewport_size = viewport_size or getattr(config, 'DEFAULT_CARD_VIEWPORT', (1200, 800))
         self.viewport_width, self.viewport_height = viewport_size
         self.video_fps = video_fps or getattr(config, 'DEFAULT_CARD_FPS', 30)
+        self.capture_mode = getattr(config, 'DEFAULT_CARD_CAPTURE_MODE', 'native')
+        self.concurrency = getattr(config, 'DEFAULT_CARD_CONCURRENCY', 4)
+        self.dedupe = getattr(config, 'DEFAULT_CARD_DEDUPE', True)
+        self.encoder_args = list(getattr(config, 'DEFAULT_CARD_ENCODER_ARGS', [
+            '-deadline', 'realtime', '-cpu-used', '8', '-lag-in-frames', '0',
+            '-error-resilient', '1', '-auto-alt-ref', '0'
+        ]))
+        
+        # Hardware encoding for the ffmpeg-based capture modes ('auto' uses VAAPI when present);
+        # resolved on first encode so native-mode runs never probe the GPU
+        self.hw_encoder_setting = getattr(config, 'DEFAULT_CARD_HW_ENCODER', 'auto')
+        self._hw_encoder = None
         self.job_id = job_id
         
+        # Weather data fetched once per capture batch and served to every card page
+        self._weather_data = None
+        
+        # Playwright and Chromium are started on first capture and kept until close()
+        self._playwright = None
+        self._browser = None
+        self._browser_headless = None
+        
+        # Flask health check: one HTTP session, result trusted for HEALTH_CHECK_TTL seconds
+        self._http_session = None
+        self._health_ok_until = 0.0
+        
         print(f"[CARD_RECORDER] Using configuration defaults:")
         print(f"[CARD_RECORDER] Flask URL: {self.flask_url}")
         print(f"[CARD_RECORDER] Viewport: {self.viewport_width}x{self.viewport_height}")
         print(f"[CARD_RECORDER] Video FPS: {self.video_fps}")
+        print(f"[CARD_RECORDER] Capture mode: {self.capture_mode}")
+        print(f"[CARD_RECORDER] Concurrent captures: {self.concurrency}")
+        print(f"[CARD_RECORDER] Hardware encoder: {self.hw_encoder_setting}")
+        print(f"[CARD_RECORDER] Static frame dedupe: {self.dedupe}")
+        print(f"[CARD_RECORDER] libvpx tuning: {' '.join(self.encoder_args)}")
         
         # Set output directory - use config defaults
         self.output_dir = Path(getattr(config, 'DEFAULT_CARD_OUTPUT_DIR', 'generated/media'))
@@ -117,32 +206,45 @@ class WeatherCardRecorder:
         
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
+        # Card URLs and output paths are fixed for the recorder's lifetime
+        self._card_urls = {k: self.get_weather_card_url(k) for k in WEATHER_CARD_DESCRIPTIONS}
+        self._card_paths = {k: self.output_dir / self.get_card_filename(k) for k in WEATHER_CARD_DESCRIPTIONS}
+        
         print(f"[CARD_RECORDER] Initialized capture system")
         print(f"[CARD_RECORDER] Job ID: {self.job_id}")
         print(f"[CARD_RECORDER] Output directory: {self.output_dir}")
         
         logger.info(f"WeatherCardRecorder initialized with output: {self.output_dir}")
     
-    def check_flask_server(self) -> bool:
-        """Check if Flask server is running and accessible"""
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Return the recorder's keep-alive HTTP session to Flask, opening it on first use"""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10))
+        return self._http_session
+    
+    async def check_flask_server(self) -> bool:
+        """Check if Flask server is running and accessible (cached for HEALTH_CHECK_TTL seconds)"""
+        if time.monotonic() < self._health_ok_until:
+            return True
+        
         try:
             print(f"[CARD_RECORDER] Checking Flask server availability...")
             
             # Check health endpoint
             health_url = f"{self.flask_url}/api/health"
-            response = requests.get(health_url, timeout=10)
-            
-            if response.status_code == 200:
-                health_data = response.json()
-                print(f"[CARD_RECORDER] ✅ Flask server is healthy")
-                print(f"[CARD_RECORDER] Server: {health_data.get('server', 'Unknown')}")
-                print(f"[CARD_RECORDER] Available files: {health_data.get('available_files', 0)}")
-                return True
-            else:
-                print(f"[CARD_RECORDER] ❌ Flask server health check failed: {response.status_code}")
-                return False
+            async with self._get_http_session().get(health_url) as response:
+                if response.status == 200:
+                    health_data = await response.json()
+                    print(f"[CARD_RECORDER] ✅ Flask server is healthy")
+                    print(f"[CARD_RECORDER] Server: {health_data.get('server', 'Unknown')}")
+                    print(f"[CARD_RECORDER] Available files: {health_data.get('available_files', 0)}")
+                    self._health_ok_until = time.monotonic() + HEALTH_CHECK_TTL
+                    return True
+                else:
+                    print(f"[CARD_RECORDER] ❌ Flask server health check failed: {response.status}")
+                    return False
                 
-        except requests.exceptions.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             print(f"[CARD_RECORDER] ❌ Flask server not accessible: {str(e)}")
             print(f"[CARD_RECORDER] Make sure to start the Flask app with: python app.py")
             return False
@@ -154,45 +256,22 @@ class WeatherCardRecorder:
         
         # Map card-* format to URL parameter format
         url_param = card_key.replace('card-', '')
-        url = f"{self.flask_url}/?card={url_param}&data=api/weather/generated"
+        url = f"{self.flask_url}/?card={url_param}&data={WEATHER_DATA_PATH}"
         return url
     
     def get_card_filename(self, card_key: str) -> str:
         """Generate filename for a card"""
-        return f"card-{card_key.replace('card-', '')}.webm"
+        return _card_filename(card_key)
     
     def get_card_duration(self, card_key: str) -> int:
         """Get default duration for a card from config or fallback"""
-        # Try to get from config first
-        duration_config = getattr(config, 'DEFAULT_CARD_DURATIONS', {})
-        if duration_config and card_key in duration_config:
-            return duration_config[card_key]
-        
-        # Fallback duration map
-        duration_map = {
-            'card-temperature': 6,
-            'card-feels-like': 5,
-            'card-cloud-cover': 5,
-            'card-precipitation': 7,
-            'card-wind': 6,
-            'card-humidity': 6,
-            'card-uv': 5,
-            'card-aqi': 5,
-            'card-visibility': 5,
-            'card-pressure': 6,
-            'card-sun': 6,
-            'card-moon': 5,
-            'card-current': 8,
-            'card-hourly': 10,
-            'weather_overview': 10,
-            'weather_current_overview': 8
-        }
-        return duration_map.get(card_key, 5)
+        return _DURATIONS.get(card_key, 5)
     
     async def capture_weather_card(self, 
                                    card_key: str, 
                                    custom_duration: Optional[int] = None,
-                                   headless: bool = True) -> str:
+                                   headless: bool = True,
+                                   browser=None) -> str:
         """
         Capture a single weather card as a WebM video
         
@@ -200,6 +279,7 @@ class WeatherCardRecorder:
             card_key: Key identifying the weather card type (e.g., 'card-temperature')
             custom_duration: Override default duration for this card
             headless: Whether to run browser in headless mode
+            browser: Playwright browser to open the card in (defaults to the recorder's persistent browser)
             
         Returns:
             Path to the generated video file
@@ -210,11 +290,10 @@ class WeatherCardRecorder:
         if card_key not in WEATHER_CARD_DESCRIPTIONS:
             raise ValueError(f"Unknown weather card: {card_key}")
         
-        # Build URL for the weather card
-        card_url = self.get_weather_card_url(card_key)
+        card_url = self._card_urls[card_key]
         duration = custom_duration or self.get_card_duration(card_key)
-        output_filename = self.get_card_filename(card_key)
-        output_path = self.output_dir / output_filename
+        output_path = self._card_paths[card_key]
+        output_filename = output_path.name
         
         print(f"[CARD_RECORDER] URL: {card_url}")
         print(f"[CARD_RECORDER] Duration: {duration}s")
@@ -222,53 +301,9 @@ class WeatherCardRecorder:
         print(f"[CARD_RECORDER] Description: {get_description(card_key)}")
         
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=headless)
-                context = await browser.new_context(
-                    viewport={'width': self.viewport_width, 'height': self.viewport_height}
-                )
-                page = await context.new_page()
-                
-                print(f"[CARD_RECORDER] Loading page...")
-                await page.goto(card_url)
-                await page.wait_for_load_state('networkidle')
-                await asyncio.sleep(3)  # Allow animations to settle
-                
-                # Setup video writer
-                fourcc = cv2.VideoWriter_fourcc(*'VP80')  # VP8 codec for WebM
-                out = cv2.VideoWriter(str(output_path), fourcc, self.video_fps, 
-                                    (self.viewport_width, self.viewport_height))
-                
-                print(f"[CARD_RECORDER] Recording video for {duration} seconds at {self.video_fps} fps...")
-                start_time = time.time()
-                frame_count = 0
-                target_frames = duration * self.video_fps
-                
-                try:
-                    while frame_count < target_frames:
-                        # Take screenshot and convert to video frame
-                        screenshot = await page.screenshot()
-                        image = Image.open(io.BytesIO(screenshot))
-                        frame = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
-                        out.write(frame)
-                        frame_count += 1
-                        
-                        elapsed = time.time() - start_time
-                        if frame_count % 30 == 0:  # Print every 30 frames (1 second at 30fps)
-                            print(f"[CARD_RECORDER] Recording {card_key}: {elapsed:.1f}s - Frames: {frame_count}/{target_frames}")
-                        
-                        # Don't sleep too long - just a small delay to prevent overwhelming
-                        await asyncio.sleep(0.01)
-                        
-                except KeyboardInterrupt:
-                    print("[CARD_RECORDER] Recording stopped by user")
-                finally:
-                    out.release()
-                    
-                final_duration = time.time() - start_time
-                print(f"[CARD_RECORDER] Recorded {card_key}: {frame_count} frames in {final_duration:.1f}s")
-                
-                await browser.close()
+            # Only a fresh context + page per card; the browser is shared
+            browser = browser or await self._get_browser(headless)
+            await self._record(browser, card_key, card_url, duration, output_path)
             
             print(f"[CARD_RECORDER] ✅ Successfully captured: {output_filename}")
             logger.info(f"Captured weather card {card_key}: {output_path}")
@@ -281,6 +316,375 @@ class WeatherCardRecorder:
             logger.error(error_msg)
             raise
     
+    async def _get_browser(self, headless: bool):
+        """Return the recorder's persistent browser, launching it on first use"""
+        if self._browser is None or not self._browser.is_connected() or self._browser_headless != headless:
+            # Relaunch only the browser; the Flask health-check session stays open
+            await self._close_browser()
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(headless=headless)
+            self._browser_headless = headless
+        return self._browser
+    
+    async def close(self):
+        """Close the persistent browser, stop Playwright and close the HTTP session"""
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
+        await self._close_browser()
+    
+    async def _close_browser(self):
+        """Close the persistent browser and stop Playwright"""
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+    
+    async def _new_context(self, browser, **context_options):
+        """Create a browser context for one card, serving the batch's cached weather data if any"""
+        # Render at 1x on a desktop profile; HiDPI hosts would otherwise paint and capture a 2x surface
+        context_options = {
+            'device_scale_factor': 1,
+            'is_mobile': False,
+            'has_touch': False,
+            'java_script_enabled': True,
+            **context_options
+        }
+        context = await browser.new_context(**context_options)
+        
+        if self._weather_data is not None:
+            weather_data = self._weather_data
+            
+            async def fulfill_weather_data(route):
+                await route.fulfill(
+                    status=200,
+                    content_type='application/json',
+                    headers={'Cache-Control': 'max-age=300'},
+                    body=weather_data
+                )
+            
+            await context.route(f"**/{WEATHER_DATA_PATH}", fulfill_weather_data)
+        
+        return context
+    
+    async def fetch_weather_data(self) -> Optional[bytes]:
+        """Fetch the weather data payload the cards load, or None if it is unavailable"""
+        try:
+            async with self._get_http_session().get(f"{self.flask_url}/{WEATHER_DATA_PATH}") as response:
+                response.raise_for_status()
+                content = await response.read()
+            print(f"[CARD_RECORDER] Cached weather data for this batch ({len(content)} bytes)")
+            return content
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"[CARD_RECORDER] ⚠️ Could not prefetch weather data, cards will load it themselves: {str(e)}")
+            return None
+    
+    async def _warm_card_page(self, card_url: str):
+        """Request the card page once so Flask has it warm before Chromium loads it"""
+        try:
+            async with self._get_http_session().get(card_url) as response:
+                await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"[CARD_RECORDER] ⚠️ Could not warm card page: {str(e)}")
+    
+    async def _record(self, browser, card_key: str, card_url: str, duration: int, output_path: Path):
+        """Record a card with the configured capture mode"""
+        if self.capture_mode == 'screenshot':
+            await self._record_screenshots(browser, card_key, card_url, duration, output_path)
+        elif self.capture_mode == 'screencast':
+            await self._record_screencast(browser, card_key, card_url, duration, output_path)
+        else:
+            await self._record_native(browser, card_key, card_url, duration, output_path)
+    
+    async def _wait_until_ready(self, page):
+        """Wait for the card page to flag itself ready, then for two paints so the first frame is complete"""
+        try:
+            await page.wait_for_selector(CARD_READY_SELECTOR, state='attached', timeout=10000)
+        except Exception as e:
+            print(f"[CARD_RECORDER] ⚠️ Card did not report ready, recording anyway: {str(e)}")
+        await page.evaluate('() => new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)))')
+    
+    async def _record_native(self, browser, card_key: str, card_url: str, duration: int, output_path: Path):
+        """Record a card with Playwright's built-in screencast recorder (no per-frame Python work)"""
+        viewport = {'width': self.viewport_width, 'height': self.viewport_height}
+        context = await self._new_context(
+            browser,
+            viewport=viewport,
+            record_video_dir=str(self.output_dir / '.recordings'),
+            record_video_size=viewport
+        )
+        try:
+            page = await context.new_page()
+            record_start = time.time()
+            
+            print(f"[CARD_RECORDER] Loading page...")
+            await page.goto(card_url)
+            await page.wait_for_load_state('networkidle')
+            await self._wait_until_ready(page)
+            
+            # Recording starts with the context, so everything up to here is cut afterwards
+            lead_in = time.time() - record_start
+            
+            print(f"[CARD_RECORDER] Recording video for {duration} seconds (native recorder)...")
+            await asyncio.sleep(duration)
+            
+            # The video file is only finalized once the context is closed
+            await context.close()
+            raw_path = await page.video.path()
+        finally:
+            await context.close()
+        
+        await self._trim_recording(raw_path, output_path, lead_in, duration)
+        print(f"[CARD_RECORDER] Recorded {card_key}: {duration}s after {lead_in:.1f}s page load")
+    
+    async def _trim_recording(self, raw_path: str, output_path: Path, lead_in: float, duration: int):
+        """Cut the page-load lead-in from a native recording and write it to output_path"""
+        process = await asyncio.create_subprocess_exec(
+            'ffmpeg', '-y', '-v', 'error',
+            '-ss', f"{lead_in:.3f}", '-i', str(raw_path), '-t', str(duration),
+            '-r', str(self.video_fps), '-c:v', 'libvpx', '-b:v', '2M', *self.encoder_args, '-an',
+            str(output_path)
+        )
+        if await process.wait() == 0:
+            os.remove(raw_path)
+        else:
+            # Keep the untrimmed recording rather than losing the card
+            print(f"[CARD_RECORDER] ⚠️ Could not trim recording, keeping full video")
+            os.replace(raw_path, output_path)
+    
+    @property
+    def hw_encoder(self) -> str:
+        """Encoder the ffmpeg-based capture modes use: 'vaapi' or 'none', probed on first use"""
+        if self._hw_encoder is None:
+            use_vaapi = self.hw_encoder_setting in ('auto', 'vaapi') and vaapi_vp9_available()
+            self._hw_encoder = 'vaapi' if use_vaapi else 'none'
+            if self.hw_encoder_setting == 'vaapi' and not use_vaapi:
+                print(f"[CARD_RECORDER] ⚠️ VAAPI VP9 encoder not available, using libvpx-vp9")
+        return self._hw_encoder
+    
+    def _encoder_command(self, input_args: List[str], output_path: Path) -> List[str]:
+        """Build the ffmpeg command that encodes frames read from stdin into a VP9 WebM"""
+        if self.hw_encoder == 'vaapi':
+            # Upload frames to the GPU and encode there; CPU only converts to NV12
+            device_args = ['-vaapi_device', VAAPI_DEVICE]
+            encoder_args = ['-vf', 'format=nv12,hwupload', '-c:v', 'vp9_vaapi', '-b:v', '2M']
+        else:
+            device_args = []
+            encoder_args = [
+                '-c:v', 'libvpx-vp9', '-b:v', '2M', *self.encoder_args,
+                '-row-mt', '1', '-tile-columns', '2', '-threads', str(os.cpu_count() or 1)
+            ]
+            if self.dedupe:
+                # Let libvpx skip unchanged blocks cheaply; repeated card frames become near-empty P-frames
+                encoder_args += ['-static-thresh', '100']
+        
+        return [
+            'ffmpeg', '-y', '-v', 'error', *device_args,
+            *input_args, '-i', 'pipe:0',
+            *encoder_args,
+            str(output_path)
+        ]
+    
+    async def _start_encoder(self, input_args: List[str], output_path: Path):
+        """Start an ffmpeg process that encodes frames written to its stdin into a VP9 WebM"""
+        return await asyncio.create_subprocess_exec(
+            *self._encoder_command(input_args, output_path),
+            stdin=asyncio.subprocess.PIPE
+        )
+    
+    @staticmethod
+    def _encode_frames(frames: queue.Queue, stdin, errors: List[Exception]):
+        """Encoder thread: decode queued screenshots and write each as raw BGR frames to ffmpeg
+        
+        Queue items are (base64 JPEG or None to repeat the previous frame, frame count); None ends the stream.
+        The first failure is appended to errors, and the queue is drained to the end either way.
+        """
+        import cv2
+        import numpy as np
+        
+        frame_data = None
+        while True:
+            item = frames.get()
+            if item is None:
+                break
+            if errors:
+                continue  # Keep draining so the producer never blocks
+            screenshot, slots = item
+            try:
+                if screenshot is not None:
+                    # imdecode yields BGR directly, the pixel format ffmpeg expects
+                    frame = cv2.imdecode(np.frombuffer(base64.b64decode(screenshot), np.uint8), cv2.IMREAD_COLOR)
+                    if frame is None:
+                        raise ValueError("Could not decode screenshot JPEG")
+                    frame_data = memoryview(frame).cast('B')
+                for _ in range(slots):
+                    stdin.write(frame_data)
+            except Exception as e:
+                print(f"[CARD_RECORDER] ❌ Encoder failed: {str(e)}")
+                errors.append(e)
+    
+    async def _record_screencast(self, browser, card_key: str, card_url: str, duration: int, output_path: Path):
+        """Record a card from CDP screencast frames pushed by Chromium, piped into ffmpeg"""
+        context = await self._new_context(
+            browser,
+            viewport={'width': self.viewport_width, 'height': self.viewport_height}
+        )
+        try:
+            page = await context.new_page()
+            
+            print(f"[CARD_RECORDER] Loading page...")
+            await page.goto(card_url)
+            await page.wait_for_load_state('networkidle')
+            await self._wait_until_ready(page)
+            
+            # Chromium pushes a JPEG whenever the page repaints; keep only the newest one
+            cdp = await context.new_cdp_session(page)
+            latest_frame = None
+            first_frame = asyncio.Event()
+            
+            async def on_frame(params):
+                nonlocal latest_frame
+                latest_frame = base64.b64decode(params['data'])
+                first_frame.set()
+                await cdp.send('Page.screencastFrameAck', {'sessionId': params['sessionId']})
+            
+            cdp.on('Page.screencastFrame', on_frame)
+            await cdp.send('Page.startScreencast', {
+                'format': 'jpeg',
+                'quality': 80,
+                'maxWidth': self.viewport_width,
+                'maxHeight': self.viewport_height,
+                'everyNthFrame': 1
+            })
+            await asyncio.wait_for(first_frame.wait(), timeout=10)
+            
+            process = await self._start_encoder([
+                '-f', 'image2pipe', '-framerate', str(self.video_fps), '-c:v', 'mjpeg'
+            ], output_path)
+            
+            print(f"[CARD_RECORDER] Recording video for {duration} seconds at {self.video_fps} fps (screencast)...")
+            start_time = time.time()
+            frame_count = 0
+            target_frames = duration * self.video_fps
+            frame_interval = 1.0 / self.video_fps
+            
+            try:
+                # Emit the newest frame at a fixed cadence; static cards repaint rarely, so frames repeat
+                while frame_count < target_frames:
+                    process.stdin.write(latest_frame)
+                    await process.stdin.drain()
+                    frame_count += 1
+                    await asyncio.sleep(max(0.0, start_time + frame_count * frame_interval - time.time()))
+            finally:
+                await cdp.send('Page.stopScreencast')
+                process.stdin.close()
+                await process.wait()
+            
+            final_duration = time.time() - start_time
+            print(f"[CARD_RECORDER] Recorded {card_key}: {frame_count} frames in {final_duration:.1f}s")
+        finally:
+            await context.close()
+    
+    async def _record_screenshots(self, browser, card_key: str, card_url: str, duration: int, output_path: Path):
+        """Record a card frame by frame from page screenshots (fallback capture mode)"""
+        # OpenCV and NumPy are only needed by this mode; importing here keeps CLI startup light
+        # and surfaces a missing package before the encoder thread starts
+        import cv2  # noqa: F401
+        import numpy  # noqa: F401
+        
+        context = await self._new_context(
+            browser,
+            viewport={'width': self.viewport_width, 'height': self.viewport_height}
+        )
+        try:
+            page = await context.new_page()
+            
+            print(f"[CARD_RECORDER] Loading page...")
+            await page.goto(card_url)
+            await page.wait_for_load_state('networkidle')
+            await self._wait_until_ready(page)
+            
+            # Screenshots are taken over CDP directly, skipping Playwright's screenshot bookkeeping
+            cdp = await context.new_cdp_session(page)
+            screenshot_params = {'format': 'jpeg', 'quality': 85, 'captureBeyondViewport': False}
+            
+            # Setup video encoder: raw BGR frames go straight to ffmpeg's stdin
+            process = subprocess.Popen(self._encoder_command([
+                '-f', 'rawvideo', '-pix_fmt', 'bgr24',
+                '-s', f"{self.viewport_width}x{self.viewport_height}", '-r', str(self.video_fps)
+            ], output_path), stdin=subprocess.PIPE)
+            
+            # Screenshots are taken here; decoding and pipe writes run on an encoder thread
+            frames = queue.Queue(maxsize=60)
+            encoder_errors = []
+            encoder = threading.Thread(target=self._encode_frames, args=(frames, process.stdin, encoder_errors), daemon=True)
+            encoder.start()
+            
+            print(f"[CARD_RECORDER] Recording video for {duration} seconds at {self.video_fps} fps...")
+            start_time = time.time()
+            frame_count = 0
+            target_frames = duration * self.video_fps
+            
+            # Frames are scheduled on a monotonic clock so the video length matches wall-clock time
+            frame_interval = 1.0 / self.video_fps
+            next_frame_time = time.monotonic()
+            late_frames = 0
+            
+            # Static cards produce identical screenshots; those reuse the last decoded frame
+            last_screenshot = None
+            static_frames = 0
+            
+            try:
+                while frame_count < target_frames and not encoder_errors:
+                    # Take screenshot and convert to video frame (JPEG encodes and decodes much faster than PNG)
+                    screenshot = (await cdp.send('Page.captureScreenshot', screenshot_params))['data']
+                    if self.dedupe and screenshot == last_screenshot:
+                        static_frames += 1
+                        screenshot = None
+                    else:
+                        last_screenshot = screenshot
+                    
+                    # Hold this frame for every slot that passed while it was being captured
+                    behind = time.monotonic() - next_frame_time
+                    slots = min(target_frames - frame_count, max(1, int(behind / frame_interval) + 1))
+                    try:
+                        frames.put_nowait((screenshot, slots))
+                    except queue.Full:
+                        # Encoder is behind; wait without blocking the event loop
+                        await asyncio.to_thread(frames.put, (screenshot, slots))
+                    
+                    late_frames += slots - 1
+                    previous_count = frame_count
+                    frame_count += slots
+                    next_frame_time += slots * frame_interval
+                    
+                    if frame_count // self.video_fps != previous_count // self.video_fps:  # Log once per second of video
+                        logger.debug("[CARD_RECORDER] Recording {}: {:.1f}s - Frames: {}/{}",
+                                     card_key, time.time() - start_time, frame_count, target_frames)
+                    
+                    await asyncio.sleep(max(0.0, next_frame_time - time.monotonic()))
+                    
+            except KeyboardInterrupt:
+                print("[CARD_RECORDER] Recording stopped by user")
+            finally:
+                await asyncio.to_thread(frames.put, None)
+                await asyncio.to_thread(encoder.join)
+                try:
+                    process.stdin.close()
+                except OSError:
+                    pass
+                await asyncio.to_thread(process.wait)
+            
+            if encoder_errors:
+                raise RuntimeError(f"Encoding {card_key} failed: {encoder_errors[0]}") from encoder_errors[0]
+            
+            final_duration = time.time() - start_time
+            print(f"[CARD_RECORDER] Recorded {card_key}: {frame_count} frames in {final_duration:.1f}s ({late_frames} repeated for late screenshots, {static_frames} static)")
+        finally:
+            await context.close()
+    
     async def capture_all_cards(self, 
                                 custom_durations: Optional[Dict[str, int]] = None,
                                 headless: bool = True) -> Dict[str, str]:
@@ -297,42 +701,16 @@ class WeatherCardRecorder:
         print(f"\n[CARD_RECORDER] Starting capture of all weather cards")
         
         # Check Flask server first
-        if not self.check_flask_server():
+        if not await self.check_flask_server():
             raise Exception("Flask server is not available. Please start it with: python app.py")
         
-        captured_videos = {}
         cards_to_capture = list(WEATHER_CARD_DESCRIPTIONS.keys())
         
         total_cards = len(cards_to_capture)
         print(f"[CARD_RECORDER] Will capture {total_cards} weather cards")
         
-        # Capture each card
-        for i, card_key in enumerate(cards_to_capture, 1):
-            print(f"\n[CARD_RECORDER] === Card {i}/{total_cards}: {card_key} ===")
-            
-            try:
-                # Get custom duration if specified
-                duration = None
-                if custom_durations and card_key in custom_durations:
-                    duration = custom_durations[card_key]
-                
-                # Capture the card
-                video_path = await self.capture_weather_card(
-                    card_key=card_key,
-                    custom_duration=duration,
-                    headless=headless
-                )
-                
-                captured_videos[card_key] = video_path
-                
-                # Small delay between captures to avoid overwhelming the server
-                await asyncio.sleep(2)
-                
-            except Exception as e:
-                print(f"[CARD_RECORDER] ⚠️ Failed to capture {card_key}: {str(e)}")
-                logger.warning(f"Failed to capture {card_key}: {str(e)}")
-                # Continue with other cards
-                continue
+        # Capture the cards concurrently on one shared browser
+        captured_videos = await self._capture_concurrently(cards_to_capture, custom_durations, headless)
         
         print(f"\n[CARD_RECORDER] === CAPTURE COMPLETE ===")
         print(f"[CARD_RECORDER] Successfully captured: {len(captured_videos)}/{total_cards} cards")
@@ -363,44 +741,79 @@ class WeatherCardRecorder:
         print(f"\n[CARD_RECORDER] Capturing specific cards: {card_keys}")
         
         # Check Flask server first
-        if not self.check_flask_server():
+        if not await self.check_flask_server():
             raise Exception("Flask server is not available. Please start it with: python app.py")
         
-        captured_videos = {}
+        # Skip unknown card keys up front
+        valid_keys = []
+        for card_key in card_keys:
+            if card_key in WEATHER_CARD_DESCRIPTIONS:
+                valid_keys.append(card_key)
+            else:
+                print(f"[CARD_RECORDER] ⚠️ Unknown card key: {card_key}")
         
-        for i, card_key in enumerate(card_keys, 1):
-            print(f"\n[CARD_RECORDER] === Card {i}/{len(card_keys)}: {card_key} ===")
-            
-            try:
-                # Validate card key
-                if card_key not in WEATHER_CARD_DESCRIPTIONS:
-                    print(f"[CARD_RECORDER] ⚠️ Unknown card key: {card_key}")
-                    continue
+        captured_videos = await self._capture_concurrently(valid_keys, custom_durations, headless)
+        
+        print(f"\n[CARD_RECORDER] === CAPTURE COMPLETE ===")
+        print(f"[CARD_RECORDER] Successfully captured: {len(captured_videos)}/{len(card_keys)} cards")
+        
+        return captured_videos
+    
+    async def _capture_concurrently(self,
+                                    card_keys: List[str],
+                                    custom_durations: Optional[Dict[str, int]],
+                                    headless: bool) -> Dict[str, str]:
+        """
+        Capture several cards at once, each in its own context on one shared browser
+        
+        Concurrency is bounded by DEFAULT_CARD_CONCURRENCY; a few pages per browser
+        records faster than many. Failed cards are reported and skipped.
+        
+        Returns:
+            Dictionary mapping card keys to video file paths, in card_keys order
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        total_cards = len(card_keys)
+        
+        # Fetch the weather data once (every card page gets it from the cache instead of Flask),
+        # warming the card page over the same keep-alive session; all cards share one HTML shell
+        self._weather_data, _ = await asyncio.gather(
+            self.fetch_weather_data(),
+            self._warm_card_page(self._card_urls[card_keys[0]]) if card_keys else asyncio.sleep(0)
+        )
+        
+        async def capture_one(i: int, card_key: str, browser) -> str:
+            async with semaphore:
+                print(f"\n[CARD_RECORDER] === Card {i}/{total_cards}: {card_key} ===")
                 
                 # Get custom duration if specified
                 duration = None
                 if custom_durations and card_key in custom_durations:
                     duration = custom_durations[card_key]
                 
-                # Capture the card
-                video_path = await self.capture_weather_card(
+                return await self.capture_weather_card(
                     card_key=card_key,
                     custom_duration=duration,
-                    headless=headless
+                    headless=headless,
+                    browser=browser
                 )
-                
-                captured_videos[card_key] = video_path
-                
-                # Small delay between captures
-                await asyncio.sleep(2)
-                
-            except Exception as e:
-                print(f"[CARD_RECORDER] ⚠️ Failed to capture {card_key}: {str(e)}")
-                logger.warning(f"Failed to capture {card_key}: {str(e)}")
-                continue
         
-        print(f"\n[CARD_RECORDER] === CAPTURE COMPLETE ===")
-        print(f"[CARD_RECORDER] Successfully captured: {len(captured_videos)}/{len(card_keys)} cards")
+        browser = await self._get_browser(headless)
+        try:
+            results = await asyncio.gather(
+                *[capture_one(i, card_key, browser) for i, card_key in enumerate(card_keys, 1)],
+                return_exceptions=True
+            )
+        finally:
+            self._weather_data = None
+        
+        captured_videos = {}
+        for card_key, result in zip(card_keys, results):
+            if isinstance(result, Exception):
+                print(f"[CARD_RECORDER] ⚠️ Failed to capture {card_key}: {str(result)}")
+                logger.warning(f"Failed to capture {card_key}: {str(result)}")
+            else:
+                captured_videos[card_key] = result
         
         return captured_videos
     
@@ -581,10 +994,12 @@ Examples:
         print(f"\n❌ Error: {str(e)}")
         logger.error(f"Weather card capture failed: {str(e)}")
         sys.exit(1)
+    finally:
+        await recorder.close()
 
 if __name__ == "__main__":
     # Configure logging
     logger.remove()
-    logger.add(sys.stdout, level="INFO", format="{time:HH:mm:ss} | {level:8} | {message}")
+    logger.add(sys.stdout, level="INFO", format="{time:HH:mm:ss} | {level:8} | {message}", enqueue=True)
     
     asyncio.run(main()) 
\ No newline at end of file
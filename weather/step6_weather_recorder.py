@@ -9,6 +9,7 @@ to capture weather data from various Philippine cities for multimedia compositio
 
 Features:
 - Captures screenshots or videos of weather pages
+- Native Playwright video recording, with a CDP screencast fallback (DEFAULT_WEATHER_CAPTURE_MODE)
 - Supports multiple Philippine cities
 - Uses centralized configuration from config.py
 - Saves to generated/media/ directory
@@ -24,6 +25,11 @@ Usage Examples:
     media_path = recorder.capture_weather(
         city_key="pulilan"
     )
+    
+    # Reuse one browser across several captures
+    with ProvincialWeatherRecorder() as recorder:
+        recorder.capture_weather("pulilan")
+        recorder.capture_weather("baguio", capture_type="screenshot")
 
 2. Command line:
     python step6_weather_recorder.py --city=pulilan --type=screenshot
@@ -37,9 +43,9 @@ Usage Examples:
 File Structure Created:
 
     generated/media/
-    ├── pulilan_weather_map1_20250525_143022.png
+    ├── pulilan_weather_map1_20250525_143022.jpg
     ├── pulilan_weather_map2_20250525_143045.webm
-    └── manila_weather_20250525_143102.png
+    └── manila_weather_20250525_143102.jpg
     
 python step6_weather_recorder.py --city=pulilan --type=video --duration=10 --output weather_map1
 python step6_weather_recorder.py --city=pulilan2 --type=video --duration=10 --output weather_map2
@@ -47,103 +53,205 @@ python step6_weather_recorder.py --city=pulilan2 --type=video --duration=10 --ou
 
 import os
 import time
-import cv2
-import numpy as np
+import base64
+import subprocess
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from PIL import Image
-import io
 from loguru import logger
-from playwright.sync_api import sync_playwright
-from typing import Dict, Any, Optional, Union, List
+from typing import Dict, Optional, Union, List
 import config
 
+@dataclass(frozen=True, slots=True)
+class CityConfig:
+    """Capture settings for one city's weather page"""
+    name: str
+    url: str
+    link_text: str
+    file_prefix: str
+    ready_selector: Optional[str] = None  # Element that shows the map has rendered
+    settle_ms: int = 0  # Extra wait once ready_selector shows, for maps that paint after their element appears
+
 # Configuration for different cities - now stored in config system
 DEFAULT_CITY_CONFIGS = {
     "pulilan": {
         "name": "Pulilan",
         "url": "https://www.windy.com/14.906/120.851?temp,14.903,120.852,14",
         "link_text": "Pulilan",
-        "file_prefix": "pulilan_weather_map1"
+        "file_prefix": "pulilan_weather_map1",
+        "ready_selector": ".leaflet-tile-loaded"
     },
     "pulilan2": {
         "name": "Pulilan",
         "url": "https://www.ventusky.com/14.930;120.850",
         "link_text": "Pulilan",
-        "file_prefix": "pulilan_weather_map2"
+        "file_prefix": "pulilan_weather_map2",
+        "ready_selector": "canvas",
+        "settle_ms": 1500
     },
     "calayan": {
         "name": "Calayan",
         "url": "https://www.ventusky.com/?p=19.22;121.38;8&l=feel",
         "link_text": "Calayan",
-        "file_prefix": "calayan_weather"
+        "file_prefix": "calayan_weather",
+        "ready_selector": "canvas",
+        "settle_ms": 1500
     },
     "aparri": {
         "name": "Aparri",
         "url": "https://www.ventusky.com/?p=18.21;122.48;8&l=feel",
         "link_text": "Aparri",
-        "file_prefix": "aparri_weather"
+        "file_prefix": "aparri_weather",
+        "ready_selector": "canvas",
+        "settle_ms": 1500
     },
     "baguio": {
         "name": "Baguio City",
         "url": "https://www.ventusky.com/?p=16.29;121.58;8&l=feel",
         "link_text": "Baguio City",
-        "file_prefix": "baguio_weather"
+        "file_prefix": "baguio_weather",
+        "ready_selector": "canvas",
+        "settle_ms": 1500
     },
     "laoag": {
         "name": "Laoag City",
         "url": "https://www.ventusky.com/?p=18.27;121.35;8&l=feel",
         "link_text": "Laoag City",
-        "file_prefix": "laoag_weather"
+        "file_prefix": "laoag_weather",
+        "ready_selector": "canvas",
+        "settle_ms": 1500
     },
     "manila": {
         "name": "Metro Manila",
         "url": "https://www.ventusky.com/?p=14.46;122.07;8&l=feel",
         "link_text": "Maynila",
-        "file_prefix": "manila_weather"
+        "file_prefix": "manila_weather",
+        "ready_selector": "canvas",
+        "settle_ms": 1500
     },
     "tuguegarao": {
         "name": "Tuguegarao City",
         "url": "https://www.ventusky.com/?p=17.37;122.45;8&l=feel",
         "link_text": "Tuguegarao City",
-        "file_prefix": "tuguegarao_weather"
+        "file_prefix": "tuguegarao_weather",
+        "ready_selector": "canvas",
+        "settle_ms": 1500
     },
     "santiago_isabela": {
         "name": "Santiago Isabela",
         "url": "https://www.ventusky.com/?p=16.98;122.21;8&l=feel",
         "link_text": "Santiago",
-        "file_prefix": "santiago_weather"
+        "file_prefix": "santiago_weather",
+        "ready_selector": "canvas",
+        "settle_ms": 1500
     },
     "banaue_ifugao": {
         "name": "Banaue Ifugao",
         "url": "https://www.ventusky.com/?p=16.71;121.27;8&l=feel",
         "link_text": "Banaue",
-        "file_prefix": "banaue_weather"
+        "file_prefix": "banaue_weather",
+        "ready_selector": "canvas",
+        "settle_ms": 1500
     },
     "vigan": {
         "name": "Vigan City",
         "url": "https://www.ventusky.com/?p=17.53;121.32;8&l=feel",
         "link_text": "Vigan City",
-        "file_prefix": "vigan_weather"
+        "file_prefix": "vigan_weather",
+        "ready_selector": "canvas",
+        "settle_ms": 1500
     },
     "san_fernando_la_union": {
         "name": "San Fernando La Union",
         "url": "https://www.ventusky.com/?p=16.534;120.749;9&l=feel",
         "link_text": "San Fernando",
-        "file_prefix": "san_fernando_la_union_weather"
+        "file_prefix": "san_fernando_la_union_weather",
+        "ready_selector": "canvas",
+        "settle_ms": 1500
     },
     "urdaneta": {
         "name": "Urdaneta",
         "url": "https://www.ventusky.com/?p=15.841;120.977;9&l=feel",
         "link_text": "Urdaneta",
-        "file_prefix": "urdaneta_weather"
+        "file_prefix": "urdaneta_weather",
+        "ready_selector": "canvas",
+        "settle_ms": 1500
     }
 }
 
 # Load city configs from config or use defaults
-CITY_CONFIGS = getattr(config, 'PROVINCIAL_WEATHER_CITIES', DEFAULT_CITY_CONFIGS)
+CITY_CONFIGS: Dict[str, CityConfig] = {
+    key: CityConfig(**city_config)
+    for key, city_config in getattr(config, 'PROVINCIAL_WEATHER_CITIES', DEFAULT_CITY_CONFIGS).items()
+}
+
+# City keys for validation (set) and CLI choices / messages (ordered)
+_CITY_KEYS = frozenset(CITY_CONFIGS)
+_CITY_NAMES = tuple(CITY_CONFIGS)
 
 print(f"[WEATHER_RECORDER] Loaded {len(CITY_CONFIGS)} city configurations from config")
 
+# Injected before Ventusky's own scripts so the header never renders
+VENTUSKY_HIDE_HEADER_SCRIPT = """
+document.addEventListener('DOMContentLoaded', () => {
+    const style = document.createElement('style');
+    style.textContent = '#header { display: none !important; }';
+    document.head.appendChild(style);
+});
+"""
+
+# Requests that never show up in a map capture; Chromium drops them itself via CDP, so no
+# route handler is installed (routing would disable the HTTP cache). Map tiles and fonts stay allowed.
+BLOCKED_URL_PATTERNS = (
+    "*google-analytics*", "*googletagmanager*", "*doubleclick*", "*hotjar*",
+    "*.mp4*", "*.webm*", "*.mp3*", "*.m4a*", "*.ogg*",
+)
+
+def _block_unneeded_requests(page):
+    """Have Chromium drop analytics and media requests for this page"""
+    cdp = page.context.new_cdp_session(page)
+    cdp.send('Network.enable')
+    cdp.send('Network.setBlockedURLs', {'urls': list(BLOCKED_URL_PATTERNS)})
+    return cdp
+
+# VP9 settings tuned for live encoding: fast preset, multithreaded rows
+VP9_ENCODER_ARGS = [
+    '-c:v', 'libvpx-vp9', '-b:v', '1M',
+    '-deadline', 'realtime', '-cpu-used', '6',
+    '-row-mt', '1', '-threads', str(os.cpu_count() or 1)
+]
+
+# Relaunch the pooled browser after this many contexts to keep Chromium's memory in check
+BROWSER_POOL_RECYCLE_AFTER = 100
+
+# Chromium features a single-page capture never uses; skipping them shortens startup and lowers RSS
+CHROMIUM_ARGS = [
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-default-apps",
+    "--disable-translate",
+    "--disable-sync",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-features=TranslateUI",
+    "--disable-renderer-backgrounding",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-dev-shm-usage",
+    "--metrics-recording-only",
+    "--mute-audio"
+]
+
+class _BrowserPool(threading.local):
+    """Per-thread Playwright state; the sync API must stay on the thread that started it"""
+    
+    def __init__(self):
+        self.playwright = None
+        self.browser = None
+        self.contexts_served = 0
+        self.keep_browser = False
+
 class ProvincialWeatherRecorder:
     """Weather recorder that saves to generated/media/ folder with config integration"""
     
@@ -156,15 +264,80 @@ class ProvincialWeatherRecorder:
         self.default_duration = getattr(config, 'DEFAULT_WEATHER_VIDEO_DURATION', 15)
         self.default_fps = getattr(config, 'DEFAULT_WEATHER_VIDEO_FPS', 1)
         self.default_viewport = getattr(config, 'DEFAULT_WEATHER_VIEWPORT', (1200, 800))
+        self.capture_mode = getattr(config, 'DEFAULT_WEATHER_CAPTURE_MODE', 'native')
         
         # Create media directory if it doesn't exist
         os.makedirs(self.media_dir, exist_ok=True)
         
+        # Per-city Chromium profiles keep tiles, fonts and service workers cached between runs, but each
+        # capture then launches its own Chromium instead of using the pooled browser (off by default)
+        self.persistent_profile = getattr(config, 'DEFAULT_WEATHER_PERSISTENT_PROFILE', False)
+        self.profile_dir = os.path.join(config.BASE_DIR, 'generated', '.pw_profile')
+        
+        # Cities captured at once by capture_multiple_cities, each worker with its own browser
+        self.max_parallel = getattr(config, 'DEFAULT_WEATHER_MAX_PARALLEL', 4)
+        
+        # Playwright and Chromium are started on first capture; kept between captures while
+        # the recorder is used as a context manager (or inside capture_multiple_cities)
+        self._pool = _BrowserPool()
+        
         print(f"[WEATHER_RECORDER] Initialized with centralized configuration")
         print(f"[WEATHER_RECORDER] Media directory: {self.media_dir}")
         print(f"[WEATHER_RECORDER] Default duration: {self.default_duration}s")
         print(f"[WEATHER_RECORDER] Default FPS: {self.default_fps}")
         print(f"[WEATHER_RECORDER] Default viewport: {self.default_viewport}")
+        print(f"[WEATHER_RECORDER] Capture mode: {self.capture_mode}")
+        print(f"[WEATHER_RECORDER] Parallel captures: {self.max_parallel}")
+        print(f"[WEATHER_RECORDER] Persistent browser profiles: {self.persistent_profile}")
+    
+    def __enter__(self):
+        self._pool.keep_browser = True
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._pool.keep_browser = False
+        self.close()
+    
+    def _get_playwright(self):
+        """Return this thread's Playwright instance, starting it on first use"""
+        if self._pool.playwright is None:
+            from playwright.sync_api import sync_playwright
+            self._pool.playwright = sync_playwright().start()
+        return self._pool.playwright
+    
+    def _get_browser(self):
+        """Return the pooled browser, launching it on first use and recycling it periodically"""
+        if self._pool.browser is not None and self._pool.contexts_served >= BROWSER_POOL_RECYCLE_AFTER:
+            print(f"[WEATHER_RECORDER] Recycling browser after {self._pool.contexts_served} captures")
+            self.close()
+        
+        if self._pool.browser is None:
+            self._pool.browser = self._get_playwright().chromium.launch(headless=True, args=CHROMIUM_ARGS)
+            self._pool.contexts_served = 0
+        return self._pool.browser
+    
+    def _new_context(self, city_key: str, **context_options):
+        """Open a context for one city: a persistent per-city profile, or a fresh context on the pooled browser"""
+        if self.persistent_profile:
+            # A user-data-dir can only be open in one Chromium at a time, hence one profile per city
+            return self._get_playwright().chromium.launch_persistent_context(
+                os.path.join(self.profile_dir, city_key),
+                headless=True,
+                args=CHROMIUM_ARGS,
+                **context_options
+            )
+        
+        self._pool.contexts_served += 1
+        return self._get_browser().new_context(**context_options)
+    
+    def close(self):
+        """Close the calling thread's pooled browser and stop its Playwright"""
+        if self._pool.browser is not None:
+            self._pool.browser.close()
+            self._pool.browser = None
+        if self._pool.playwright is not None:
+            self._pool.playwright.stop()
+            self._pool.playwright = None
     
     def capture_weather(
         self, 
@@ -172,7 +345,8 @@ class ProvincialWeatherRecorder:
         capture_type: str = "video",
         duration_seconds: int = None,
         fps: int = None,
-        output_filename: Optional[str] = None
+        output_filename: Optional[str] = None,
+        timestamp: Optional[str] = None
     ) -> Union[str, List[str]]:
         """
         Capture weather data for a city and save to generated/media/
@@ -183,14 +357,15 @@ class ProvincialWeatherRecorder:
             duration_seconds: Duration for video capture (uses config default if None)
             fps: Frames per second for video (uses config default if None)
             output_filename: Custom filename (without extension). If None, auto-generates based on city and timestamp
+            timestamp: Timestamp for auto-generated filenames (defaults to now, '%Y%m%d_%H%M%S')
             
         Returns:
             Path to the captured media file(s)
         """
         print(f"[WEATHER_RECORDER] Starting capture for {city_key}")
         
-        if city_key not in CITY_CONFIGS:
-            raise ValueError(f"City '{city_key}' not found in configurations. Available: {list(CITY_CONFIGS.keys())}")
+        if city_key not in _CITY_KEYS:
+            raise ValueError(f"City '{city_key}' not found in configurations. Available: {list(_CITY_NAMES)}")
         
         # Use config defaults if not specified
         duration_seconds = duration_seconds or self.default_duration
@@ -200,93 +375,150 @@ class ProvincialWeatherRecorder:
         
         print(f"[WEATHER_RECORDER] Using media directory: {self.media_dir}")
         
-        # Generate timestamp for unique filenames
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        
         # Determine base filename
         if output_filename:
             base_filename = output_filename
             print(f"[WEATHER_RECORDER] Using custom filename: {base_filename}")
         else:
-            base_filename = f"{city_config['file_prefix']}_{timestamp}"
+            # Timestamp for unique filenames
+            timestamp = timestamp or datetime.now().strftime('%Y%m%d_%H%M%S')
+            base_filename = f"{city_config.file_prefix}_{timestamp}"
             print(f"[WEATHER_RECORDER] Using auto-generated filename: {base_filename}")
         
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context(
-                    viewport={'width': self.default_viewport[0], 'height': self.default_viewport[1]}
+            try:
+                captured_files = self._capture_with_context(
+                    city_key, city_config, capture_type, base_filename, duration_seconds, fps
                 )
-                page = context.new_page()
-                
-                print(f"[WEATHER_RECORDER] Loading {city_config['name']} weather page...")
-                page.goto(city_config['url'])
-                page.wait_for_load_state('networkidle')
-                time.sleep(5)  # Allow page to fully load
-                
-                # Hide header element if it's a Ventusky site
-                if 'ventusky.com' in city_config['url']:
-                    try:
-                        print(f"[WEATHER_RECORDER] Hiding Ventusky header for cleaner capture...")
-                        page.evaluate("""
-                            const header = document.querySelector('#header');
-                            if (header) {
-                                header.style.display = 'none';
-                                console.log('Header hidden successfully');
-                            }
-                        """)
-                        time.sleep(1)  # Give time for the change to take effect
-                    except Exception as e:
-                        print(f"[WEATHER_RECORDER] Could not hide header: {e}")
-                
-                # Try to click on city link if needed
-                self._try_click_city_link(page, city_config)
+            finally:
+                # One-off captures release Chromium right away; pooled use keeps it for the next city
+                if not self._pool.keep_browser:
+                    self.close()
+            
+            print(f"[WEATHER_RECORDER] Capture completed for {city_config.name}")
+            logger.info(f"Weather capture completed: {city_key} → {captured_files}")
+            
+            return captured_files[0] if len(captured_files) == 1 else captured_files
+            
+        except Exception as e:
+            logger.error(f"[WEATHER_RECORDER] Error capturing weather for {city_key}: {str(e)}")
+            raise
+    
+    def _capture_with_context(
+        self,
+        city_key: str,
+        city_config: CityConfig,
+        capture_type: str,
+        base_filename: str,
+        duration_seconds: int,
+        fps: int
+    ) -> List[str]:
+        """Capture one city in its own browser context and page"""
+        viewport = {'width': self.default_viewport[0], 'height': self.default_viewport[1]}
+        
+        # Native mode: Chromium records the whole page session to WebM itself
+        record_native = capture_type in ["video", "both"] and self.capture_mode == 'native'
+        context_options = {'viewport': viewport}
+        if record_native:
+            context_options['record_video_dir'] = os.path.join(self.media_dir, '.recordings')
+            context_options['record_video_size'] = viewport
+        context = self._new_context(city_key, **context_options)
+        
+        # Hide the Ventusky header before first paint for a cleaner capture
+        if 'ventusky.com' in city_config.url:
+            print(f"[WEATHER_RECORDER] Hiding Ventusky header for cleaner capture...")
+            context.add_init_script(VENTUSKY_HIDE_HEADER_SCRIPT)
+        try:
+            # Persistent contexts open with a blank page already
+            page = context.pages[0] if context.pages else context.new_page()
+            cdp = _block_unneeded_requests(page)
+            if self.persistent_profile:
+                # Count responses the profile's cache served, to confirm reuse across runs
+                response_counts = {'total': 0, 'cached': 0}
                 
-                captured_files = []
+                def on_response_received(params):
+                    response_counts['total'] += 1
+                    if params['response'].get('fromDiskCache'):
+                        response_counts['cached'] += 1
                 
-                # Capture screenshot if requested
-                if capture_type in ["screenshot", "both"]:
-                    screenshot_path = self._capture_screenshot(
-                        page, self.media_dir, base_filename
+                cdp.on('Network.responseReceived', on_response_received)
+            record_start = time.time()
+            
+            print(f"[WEATHER_RECORDER] Loading {city_config.name} weather page...")
+            page.goto(city_config.url)
+            page.wait_for_load_state('networkidle')
+            self._wait_until_ready(page, city_config)
+            if self.persistent_profile:
+                print(f"[WEATHER_RECORDER] Profile cache served {response_counts['cached']}/{response_counts['total']} responses for {city_key}")
+            
+            # Try to click on city link if needed
+            self._try_click_city_link(page, city_config)
+            
+            captured_files = []
+            
+            # Capture screenshot if requested
+            if capture_type in ["screenshot", "both"]:
+                screenshot_path = self._capture_screenshot(
+                    page, self.media_dir, base_filename
+                )
+                captured_files.append(screenshot_path)
+                print(f"[WEATHER_RECORDER] Screenshot saved: {screenshot_path}")
+            
+            # Capture video if requested
+            if capture_type in ["video", "both"]:
+                if record_native:
+                    video_path = self._capture_native_video(
+                        page, record_start, self.media_dir, base_filename, duration_seconds, fps
                     )
-                    captured_files.append(screenshot_path)
-                    print(f"[WEATHER_RECORDER] Screenshot saved: {screenshot_path}")
-                
-                # Capture video if requested
-                if capture_type in ["video", "both"]:
+                else:
                     video_path = self._capture_video(
                         page, self.media_dir, base_filename, duration_seconds, fps
                     )
-                    captured_files.append(video_path)
-                    print(f"[WEATHER_RECORDER] Video saved: {video_path}")
-                
-                browser.close()
-                
-                print(f"[WEATHER_RECORDER] Capture completed for {city_config['name']}")
-                logger.info(f"Weather capture completed: {city_key} → {captured_files}")
-                
-                return captured_files[0] if len(captured_files) == 1 else captured_files
-                
+                captured_files.append(video_path)
+                print(f"[WEATHER_RECORDER] Video saved: {video_path}")
+        
+            
+            return captured_files
+        finally:
+            context.close()
+    
+    def _wait_until_ready(self, page, city_config: CityConfig):
+        """Wait for the map to render (city's ready_selector plus settle_ms) and web fonts to load"""
+        ready_selector = city_config.ready_selector
+        if not ready_selector:
+            page.wait_for_timeout(1000)
+            return
+        
+        try:
+            page.wait_for_selector(ready_selector, state="visible", timeout=5000)
+            page.evaluate("document.fonts.ready.then(() => true)")
+            if city_config.settle_ms:
+                # Ventusky's WebGL canvas is in the DOM before the weather layer is drawn on it
+                page.wait_for_timeout(city_config.settle_ms)
         except Exception as e:
-            logger.error(f"[WEATHER_RECORDER] Error capturing weather for {city_key}: {str(e)}")
-            raise
+            print(f"[WEATHER_RECORDER] Page not ready after 5s, capturing anyway: {e}")
     
-    def _try_click_city_link(self, page, city_config: Dict[str, Any]):
+    def _try_click_city_link(self, page, city_config: CityConfig):
         """Try to click on the city link if it exists"""
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+        
         try:
-            print(f"[WEATHER_RECORDER] Looking for {city_config['link_text']} link...")
-            city_link = page.locator(f'a:has-text("{city_config["link_text"]}")')
+            print(f"[WEATHER_RECORDER] Looking for {city_config.link_text} link...")
+            city_link = page.locator(f'a:has-text("{city_config.link_text}")').first
+            
+            # Click straight away; a missing link only costs the short timeout
+            try:
+                city_link.click(timeout=1500)
+            except PlaywrightTimeoutError:
+                print(f"[WEATHER_RECORDER] {city_config.link_text} link not found, using current view")
+                return
+            
+            print(f"[WEATHER_RECORDER] Successfully clicked on {city_config.link_text}")
+            page.wait_for_load_state('networkidle')
+            self._wait_until_ready(page, city_config)
             
-            if city_link.count() > 0:
-                city_link.first.click()
-                print(f"[WEATHER_RECORDER] Successfully clicked on {city_config['link_text']}")
-                page.wait_for_load_state('networkidle')
-                time.sleep(3)
-            else:
-                print(f"[WEATHER_RECORDER] {city_config['link_text']} link not found, using current view")
-                
         except Exception as e:
-            print(f"[WEATHER_RECORDER] Could not click on {city_config['link_text']} link: {e}")
+            print(f"[WEATHER_RECORDER] Could not click on {city_config.link_text} link: {e}")
     
     def _capture_screenshot(
         self, 
@@ -295,20 +527,56 @@ class ProvincialWeatherRecorder:
         base_filename: str
     ) -> str:
         """Capture a screenshot of the weather page"""
-        filename = f"{base_filename}.png"
+        filename = f"{base_filename}.jpg"
         screenshot_path = os.path.join(media_dir, filename)
         
-        # Take screenshot
-        screenshot = page.screenshot()
-        
-        # Save screenshot
-        with open(screenshot_path, 'wb') as f:
-            f.write(screenshot)
+        # Playwright writes the file itself; the image never passes through Python
+        page.screenshot(path=screenshot_path, full_page=False, type="jpeg", quality=85)
         
         print(f"[WEATHER_RECORDER] Screenshot captured: {screenshot_path}")
         logger.info(f"Screenshot captured: {screenshot_path}")
         return screenshot_path
     
+    def _capture_native_video(
+        self,
+        page,
+        record_start: float,
+        media_dir: str,
+        base_filename: str,
+        duration_seconds: int,
+        fps: int
+    ) -> str:
+        """Capture a video with Playwright's built-in recorder, cutting the page-load lead-in"""
+        filename = f"{base_filename}.webm"
+        video_path = os.path.join(media_dir, filename)
+        
+        # Recording started with the context, so everything up to here is cut afterwards
+        lead_in = time.time() - record_start
+        
+        print(f"[WEATHER_RECORDER] Recording video for {duration_seconds} seconds (native recorder)...")
+        page.wait_for_timeout(duration_seconds * 1000)
+        
+        # The video file is only finalized once the context is closed
+        page.context.close()
+        raw_path = page.video.path()
+        
+        result = subprocess.run([
+            'ffmpeg', '-y', '-v', 'error',
+            '-ss', f"{lead_in:.3f}", '-i', raw_path, '-t', str(duration_seconds),
+            '-r', str(fps), *VP9_ENCODER_ARGS, '-an',
+            video_path
+        ])
+        if result.returncode == 0:
+            os.remove(raw_path)
+        else:
+            # Keep the untrimmed recording rather than losing the capture
+            print(f"[WEATHER_RECORDER] ⚠️ Could not trim recording, keeping full video")
+            os.replace(raw_path, video_path)
+        
+        print(f"[WEATHER_RECORDER] Video recording completed: {video_path}")
+        logger.info(f"Video recording completed: {video_path} ({lead_in:.1f}s page load cut)")
+        return video_path
+    
     def _capture_video(
         self, 
         page, 
@@ -317,36 +585,103 @@ class ProvincialWeatherRecorder:
         duration_seconds: int,
         fps: int
     ) -> str:
-        """Capture a video of the weather page"""
+        """Capture a video of the weather page from CDP screencast frames (fallback capture mode)"""
+        # OpenCV and NumPy are only needed by this mode; importing here keeps CLI startup light
+        import cv2
+        import numpy as np
+        
         filename = f"{base_filename}.webm"
         video_path = os.path.join(media_dir, filename)
         
-        # Setup video writer for WebM format
-        fourcc = cv2.VideoWriter_fourcc(*'VP80')  # VP8 codec for WebM
-        out = cv2.VideoWriter(video_path, fourcc, fps, self.default_viewport)
+        # Setup video encoder: raw YUV420P frames go straight to ffmpeg's stdin (WebM/VP9)
+        width, height = self.default_viewport
+        encoder = subprocess.Popen([
+            'ffmpeg', '-y', '-v', 'error',
+            '-f', 'rawvideo', '-pix_fmt', 'yuv420p', '-s', f"{width}x{height}", '-r', str(fps), '-i', '-',
+            *VP9_ENCODER_ARGS,
+            video_path
+        ], stdin=subprocess.PIPE)
+        
+        # Chromium pushes a JPEG over CDP whenever the page repaints; keep only the newest one
+        cdp = page.context.new_cdp_session(page)
+        latest_screenshot = [None]
+        
+        def on_screencast_frame(params):
+            latest_screenshot[0] = params['data']
+            cdp.send('Page.screencastFrameAck', {'sessionId': params['sessionId']})
+        
+        cdp.on('Page.screencastFrame', on_screencast_frame)
+        cdp.send('Page.startScreencast', {
+            'format': 'jpeg',
+            'quality': 70,
+            'maxWidth': self.default_viewport[0],
+            'maxHeight': self.default_viewport[1],
+            'everyNthFrame': max(1, 30 // fps)
+        })
         
         print(f"[WEATHER_RECORDER] Recording video for {duration_seconds} seconds at {fps} fps...")
         start_time = time.time()
         frame_count = 0
+        decoded_screenshot = None
+        last_log = 0.0
+        
+        # Frame buffers reused for the whole recording: BGR for resizing, I420 for the encoder
+        frame = np.empty((height, width, 3), dtype=np.uint8)
+        yuv_frame = np.empty((height * 3 // 2, width), dtype=np.uint8)
+        has_frame = False
+        
+        # Fixed-timestep schedule: frame N is due at start + N/fps, whatever the decode/encode took
+        target_frames = duration_seconds * fps
+        frame_interval = 1.0 / fps
+        next_frame_at = time.time()
         
         try:
-            while (time.time() - start_time) < duration_seconds:
-                # Take screenshot and convert to video frame
-                screenshot = page.screenshot()
-                image = Image.open(io.BytesIO(screenshot))
-                frame = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
-                out.write(frame)
-                frame_count += 1
+            while frame_count < target_frames:
+                # Decode only when Chromium has pushed a new frame; otherwise repeat the last one
+                screenshot = latest_screenshot[0]
+                if screenshot is not None and screenshot is not decoded_screenshot:
+                    decoded = cv2.imdecode(np.frombuffer(base64.b64decode(screenshot), np.uint8), cv2.IMREAD_COLOR)
+                    decoded_screenshot = screenshot
+                    if decoded is not None:
+                        if decoded.shape != frame.shape:
+                            decoded = cv2.resize(decoded, (width, height), dst=frame)
+                        # Convert once per new frame; repeated frames reuse the I420 buffer as is
+                        cv2.cvtColor(decoded, cv2.COLOR_BGR2YUV_I420, dst=yuv_frame)
+                        has_frame = True
+                    # A JPEG that fails to decode is skipped; the previous frame is sent again
+                
+                if has_frame:
+                    encoder.stdin.write(yuv_frame)
+                    frame_count += 1
+                    next_frame_at += frame_interval
+                elif time.time() - start_time > 10:
+                    print("[WEATHER_RECORDER] ❌ No screencast frames received after 10s")
+                    break
+                else:
+                    # Nothing painted yet; keep the schedule anchored to the first frame
+                    next_frame_at = time.time() + 0.01
                 
+                # Progress goes out at most once per second to keep stdout off the frame path
                 elapsed = time.time() - start_time
-                print(f"[WEATHER_RECORDER] Recording: {elapsed:.1f}/{duration_seconds}s - Frames: {frame_count}")
+                if elapsed - last_log >= 1.0:
+                    print(f"[WEATHER_RECORDER] Recording: {elapsed:.1f}/{duration_seconds}s - Frames: {frame_count}")
+                    last_log = elapsed
                 
-                time.sleep(1/fps)
+                # Waiting through Playwright lets it deliver screencast frames in the meantime
+                page.wait_for_timeout(max(0.0, next_frame_at - time.time()) * 1000)
                 
         except KeyboardInterrupt:
             print("[WEATHER_RECORDER] Recording stopped by user")
+        except BrokenPipeError:
+            print("[WEATHER_RECORDER] ❌ ffmpeg encoder exited early")
         finally:
-            out.release()
+            cdp.send('Page.stopScreencast')
+            cdp.detach()
+            try:
+                encoder.stdin.close()
+            except BrokenPipeError:
+                pass
+            encoder.wait()
             print(f"[WEATHER_RECORDER] Video recording completed: {video_path}")
             logger.info(f"Video recording completed: {video_path} ({frame_count} frames)")
         
@@ -354,12 +689,46 @@ class ProvincialWeatherRecorder:
     
     def list_available_cities(self) -> Dict[str, str]:
         """Get a list of available cities and their names"""
-        return {key: config['name'] for key, config in CITY_CONFIGS.items()}
+        return {key: city_config.name for key, city_config in CITY_CONFIGS.items()}
     
-    def get_city_config(self, city_key: str) -> Optional[Dict[str, Any]]:
+    def get_city_config(self, city_key: str) -> Optional[CityConfig]:
         """Get configuration for a specific city"""
         return CITY_CONFIGS.get(city_key)
     
+    def _capture_batch(
+        self,
+        pending: queue.Queue,
+        total: int,
+        capture_type: str,
+        timestamp: str,
+        results: Dict[str, Union[str, List[str], None]]
+    ):
+        """Worker: capture queued cities one after another on this thread's browser"""
+        # Keep one browser for the whole batch unless the caller already pooled it
+        owns_browser = not self._pool.keep_browser
+        self._pool.keep_browser = True
+        try:
+            while True:
+                try:
+                    i, city_key = pending.get_nowait()
+                except queue.Empty:
+                    break
+                
+                print(f"[WEATHER_RECORDER] Processing city {i}/{total}: {city_key}")
+                try:
+                    result = self.capture_weather(city_key, capture_type, timestamp=timestamp)
+                    results[city_key] = result
+                    print(f"[WEATHER_RECORDER] ✅ {city_key} completed")
+                    logger.info(f"City capture completed: {city_key}")
+                except Exception as e:
+                    print(f"[WEATHER_RECORDER] ❌ {city_key} failed: {str(e)}")
+                    logger.error(f"City capture failed: {city_key} - {str(e)}")
+                    results[city_key] = None
+        finally:
+            if owns_browser:
+                self._pool.keep_browser = False
+                self.close()
+    
     def capture_multiple_cities(
         self, 
         city_keys: List[str], 
@@ -368,6 +737,10 @@ class ProvincialWeatherRecorder:
         """
         Capture weather data for multiple cities
         
+        Up to DEFAULT_WEATHER_MAX_PARALLEL cities are captured at once. Playwright's sync
+        API is bound to the thread that started it, so every worker runs its own browser
+        and opens one context per city on it.
+        
         Args:
             city_keys: List of city keys to capture
             capture_type: "video", "screenshot", or "both"
@@ -379,17 +752,28 @@ class ProvincialWeatherRecorder:
         print(f"[WEATHER_RECORDER] Starting multi-city capture for {len(city_keys)} cities")
         logger.info(f"Multi-city capture started: {len(city_keys)} cities")
         
-        for i, city_key in enumerate(city_keys, 1):
-            print(f"[WEATHER_RECORDER] Processing city {i}/{len(city_keys)}: {city_key}")
-            try:
-                result = self.capture_weather(city_key, capture_type)
-                results[city_key] = result
-                print(f"[WEATHER_RECORDER] ✅ {city_key} completed")
-                logger.info(f"City capture completed: {city_key}")
-            except Exception as e:
-                print(f"[WEATHER_RECORDER] ❌ {city_key} failed: {str(e)}")
-                logger.error(f"City capture failed: {city_key} - {str(e)}")
-                results[city_key] = None
+        # One timestamp names every file in the batch
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        
+        pending = queue.Queue()
+        for item in enumerate(city_keys, 1):
+            pending.put(item)
+        
+        workers = max(1, min(self.max_parallel, len(city_keys)))
+        if workers == 1:
+            # Single worker runs on the calling thread so a browser pooled by the caller is reused
+            self._capture_batch(pending, len(city_keys), capture_type, timestamp, results)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(self._capture_batch, pending, len(city_keys), capture_type, timestamp, results)
+                    for _ in range(workers)
+                ]
+                for future in futures:
+                    future.result()
+        
+        # Report in the requested order
+        results = {city_key: results.get(city_key) for city_key in city_keys}
         
         success_count = sum(1 for r in results.values() if r is not None)
         print(f"[WEATHER_RECORDER] Multi-city capture completed. Success: {success_count}/{len(city_keys)}")
@@ -439,7 +823,7 @@ def print_usage_examples():
 📂 File Structure:
 
    generated/media/
-   ├── pulilan_weather_map1_20250525_143022.png
+   ├── pulilan_weather_map1_20250525_143022.jpg
    ├── manila_weather_20250525_143045.webm
    ├── baguio_weather_20250525_143102.webm
    └── custom_weather_video.webm
@@ -468,7 +852,7 @@ Examples:
     )
     
     parser.add_argument('--city', type=str, 
-                       choices=list(CITY_CONFIGS.keys()),
+                       choices=_CITY_NAMES,
                        help="City to capture weather for")
     parser.add_argument('--type', type=str, default="video",
                        choices=["video", "screenshot", "both"],
@@ -495,7 +879,7 @@ Examples:
         print("🏙️  Available Cities:")
         print("=" * 50)
         for key, city_config in CITY_CONFIGS.items():
-            print(f"   {key:<20} - {city_config['name']}")
+            print(f"   {key:<20} - {city_config.name}")
         print(f"\nTotal: {len(CITY_CONFIGS)} cities available")
         exit(0)
     
@@ -512,7 +896,7 @@ Examples:
     fps = args.fps or recorder.default_fps
     
     print(f"🌤️  Provincial Weather Recorder - Step 6")
-    print(f"City: {CITY_CONFIGS[args.city]['name']}")
+    print(f"City: {CITY_CONFIGS[args.city].name}")
     print(f"Output: {recorder.media_dir}")
     print(f"Capture Type: {args.type}")
     if args.output: